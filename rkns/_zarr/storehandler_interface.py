@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Iterable
@@ -18,7 +19,11 @@ class _StoreHandler(ABC):
     """Handles low-level interactions with Zarr storage for RKNS objects."""
 
     @abstractmethod
-    def __init__(self, store: Any | None) -> None:
+    def __init__(
+        self,
+        store: Any | None,
+        temporary_directory: tempfile.TemporaryDirectory | None = None,
+    ) -> None:
         pass
 
     @property
@@ -57,7 +62,10 @@ class _StoreHandler(ABC):
 
     @abstractmethod
     def create_group(
-        self, path: str | None = None, overwrite: bool = False
+        self,
+        path: str | None = None,
+        overwrite: bool = False,
+        attributes: dict[str, Any] | None = None,
     ) -> ZarrGroup:
         pass
 
@@ -90,5 +98,6 @@ class _StoreHandler(ABC):
         max_depth: int | None = None,
         compare_values: bool = True,
         compare_attributes: bool = True,
+        byte_identical_ok: bool = False,
     ) -> bool:
         pass
@@ -17,6 +17,7 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, Optional, Sequence, cast
 
+import numpy as np
 import rich
 import rich.tree
 
@@ -36,6 +37,19 @@ if TYPE_CHECKING:
 
 
 class ZarrUtils(ABC):
+    @staticmethod
+    @abstractmethod
+    def create_child_array(
+        parent_node,  # group
+        name: str,
+        shape: tuple[int, ...],
+        dtype: Any,
+        attributes: dict[str, Any] | None = None,
+        compressors: CodecType | None = None,
+        **kwargs,
+    ) -> ZarrArray:
+        raise NotImplementedError()
+
     @staticmethod
     @abstractmethod
     def add_child_array(
@@ -72,6 +86,16 @@ class ZarrUtils(ABC):
     def copy_group_recursive(source_group: ZarrGroup, target_group: ZarrGroup) -> None:
         raise NotImplementedError()
 
+    @staticmethod
+    @abstractmethod
+    def copy_store(source_store: Store, target_store: Store) -> None:
+        raise NotImplementedError()
+
+    @staticmethod
+    @abstractmethod
+    def stores_equal(store1: Store, store2: Store) -> bool:
+        raise NotImplementedError()
+
     @staticmethod
     @abstractmethod
     def deep_compare_groups(
@@ -88,6 +112,35 @@ class ZarrUtils(ABC):
     def compare_attrs(attr1: JSON, attr2: JSON) -> bool:
         raise NotImplementedError()
 
+    @staticmethod
+    def arrays_allclose(array1: ZarrArray, array2: ZarrArray) -> bool:
+        """
+        Compare the values of two arrays of equal shape.
+
+        The arrays are compared block by block along the chunks of the first axis of
+        `array1`, such that only one block of each array is held in memory, and the
+        comparison stops at the first differing block.
+
+        Parameters
+        ----------
+        array1
+            First array to compare
+        array2
+            Second array to compare, with the shape of `array1`
+
+        Returns
+        -------
+        bool
+            True if all values are close (see `np.allclose`).
+        """
+        if len(array1.shape) == 0:
+            return bool(np.allclose(array1[...], array2[...]))
+        step = max(array1.chunks[0], 1)
+        return all(
+            np.allclose(array1[start : start + step], array2[start : start + step])
+            for start in range(0, array1.shape[0], step)
+        )
+
     @staticmethod
     @abstractmethod
     def group_tree_with_attrs(
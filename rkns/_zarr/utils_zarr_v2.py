@@ -6,7 +6,6 @@ from pathlib import Path
 # this has to happen before the zarr import.
 from typing import TYPE_CHECKING, Any, Iterable, Iterator, Literal, cast
 
-import numpy as np
 import rich
 import rich.console
 import rich.tree
@@ -72,6 +71,49 @@ class _ZarrV2Utils(ZarrUtils):
         """
         zarr.convenience.copy_all(source=source_group, dest=target_group)
 
+    @staticmethod
+    def copy_store(source_store: Store, target_store: Store) -> None:
+        """
+        Copy all keys of a store to another store.
+
+        The (compressed) chunks are copied as they are, i.e., without decoding and
+        re-encoding them.
+
+        Parameters
+        ----------
+        source_store
+            Store to copy from
+        target_store
+            Store to copy to
+        """
+        zarr.convenience.copy_store(source_store, target_store, if_exists="replace")
+
+    @staticmethod
+    def stores_equal(store1: Store, store2: Store) -> bool:
+        """
+        Check whether two stores hold the same keys with byte-identical values.
+
+        The (compressed) chunks are compared as they are, i.e., without decoding them.
+        Stores with equal content may still differ in their bytes, e.g. if written
+        with different codecs.
+
+        Parameters
+        ----------
+        store1
+            First store to compare
+        store2
+            Second store to compare
+
+        Returns
+        -------
+        bool
+            True if all keys and values are identical.
+        """
+        keys = set(store1.keys())  # type: ignore
+        if keys != set(store2.keys()):  # type: ignore
+            return False
+        return all(store1[key] == store2[key] for key in keys)  # type: ignore
+
     @staticmethod
     def get_or_create_target_store(
         path_or_store: Store | Path | str, mode: Literal["r", "w", "a"] = "w"
@@ -92,6 +134,28 @@ class _ZarrV2Utils(ZarrUtils):
         else:
             raise TypeError(f"Invalid path_or_store={path_or_store}.")
 
+    @staticmethod
+    def create_child_array(
+        parent_node: ZarrGroup,
+        name: str,
+        shape: tuple[int, ...],
+        dtype: Any,
+        attributes: dict[str, Any] | None = None,
+        compressors: CodecType | None = None,
+        **kwargs,
+    ) -> ZarrArray:
+        zarr_array = parent_node.create(
+            name=name,
+            shape=shape,
+            dtype=dtype,
+            compressor=compressors,  # singular!
+            **kwargs,
+        )
+
+        if attributes is not None:
+            zarr_array.attrs.update(**attributes)
+        return zarr_array
+
     @staticmethod
     def add_child_array(
         parent_node: ZarrGroup,
@@ -101,11 +165,12 @@ class _ZarrV2Utils(ZarrUtils):
         compressors: CodecType | None = None,
         **kwargs,
     ):
-        zarr_array = parent_node.create(
+        zarr_array = _ZarrV2Utils.create_child_array(
+            parent_node=parent_node,
             name=name,
             shape=data.shape,  # type: ignore
             dtype=data.dtype,  # type: ignore
-            compressor=compressors,  # singular!
+            compressors=compressors,
             **kwargs,
         )
         zarr_array[:] = data
@@ -242,7 +307,7 @@ class _ZarrV2Utils(ZarrUtils):
                     raise ArrayShapeMismatchError(
                         f"Array shapes do not match for key '{key1}': {node1.shape} vs {node2.shape}"
                     )
-                if compare_values and not np.allclose(node1[:], node2[:]):
+                if compare_values and not _ZarrV2Utils.arrays_allclose(node1, node2):
                     raise ArrayValueMismatchError(
                         f"Array values do not match for key '{key1}'"
                     )
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 # Handle ZarrGroup compatibility across versions
 # this has to happen before the zarr import.
+import asyncio
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Iterable, Literal, Optional, cast
 
-import numpy as np
 import rich
 import rich.console
 import rich.tree
@@ -15,7 +15,9 @@ import zarr.registry
 import zarr.storage
 from zarr.abc.store import Store
 from zarr.core.attributes import Attributes
+from zarr.core.buffer import default_buffer_prototype
 from zarr.core.group import AsyncGroup
+from zarr.core.sync import sync
 
 from rkns._zarr.utils_interface import TreeRepr
 from rkns.errors import (
@@ -48,6 +50,28 @@ __all__ = ["_ZarrV3Utils"]
 
 
 class _ZarrV3Utils(ZarrUtils):
+    @staticmethod
+    def create_child_array(
+        parent_node: ZarrGroup,
+        name: str,
+        shape: tuple[int, ...],
+        dtype: Any,
+        attributes: dict[str, Any] | None = None,
+        compressors: zarr.abc.codec.BaseCodec | None = None,
+        **kwargs,
+    ) -> ZarrArray:
+        zarr_array = parent_node.create_array(
+            name=name,
+            shape=shape,
+            dtype=dtype,
+            compressors=compressors,
+            **kwargs,
+        )
+
+        if attributes is not None:
+            zarr_array.update_attributes(attributes)
+        return zarr_array
+
     @staticmethod
     def add_child_array(
         parent_node: ZarrGroup,
@@ -57,7 +81,8 @@ class _ZarrV3Utils(ZarrUtils):
         compressors: zarr.abc.codec.BaseCodec | None = None,
         **kwargs,
     ):
-        zarr_array = parent_node.create_array(
+        zarr_array = _ZarrV3Utils.create_child_array(
+            parent_node=parent_node,
             name=name,
             shape=data.shape,  # type: ignore
             dtype=data.dtype,  # type: ignore
@@ -138,6 +163,89 @@ class _ZarrV3Utils(ZarrUtils):
             target_subgroup = target_group.create_group(name)
             _ZarrV3Utils.copy_group_recursive(subgroup, target_subgroup)
 
+    @staticmethod
+    def copy_store(source_store: Store, target_store: Store) -> None:
+        """
+        Copy all keys of a store to another store.
+
+        The (compressed) chunks are copied as they are, i.e., without decoding and
+        re-encoding them. The keys are copied concurrently, bounded by zarr's
+        ``async.concurrency`` setting.
+
+        Parameters
+        ----------
+        source_store
+            Store to copy from
+        target_store
+            Store to copy to
+        """
+        prototype = default_buffer_prototype()
+        # bound the number of values held in memory at once
+        semaphore = asyncio.Semaphore(zarr.config.get("async.concurrency"))
+
+        async def copy_key(key: str) -> None:
+            async with semaphore:
+                value = await source_store.get(key, prototype=prototype)
+                if value is not None:
+                    await target_store.set(key, value)
+
+        async def copy_all_keys() -> None:
+            keys = [key async for key in source_store.list()]
+            await asyncio.gather(*(copy_key(key) for key in keys))
+
+        sync(copy_all_keys())
+
+    @staticmethod
+    def stores_equal(store1: Store, store2: Store) -> bool:
+        """
+        Check whether two stores hold the same keys with byte-identical values.
+
+        The (compressed) chunks are compared as they are, i.e., without decoding them.
+        Stores with equal content may still differ in their bytes, e.g. if written
+        with different codecs.
+
+        Parameters
+        ----------
+        store1
+            First store to compare
+        store2
+            Second store to compare
+
+        Returns
+        -------
+        bool
+            True if all keys and values are identical.
+        """
+        prototype = default_buffer_prototype()
+        semaphore = asyncio.Semaphore(zarr.config.get("async.concurrency"))
+
+        async def key_equal(key: str) -> bool:
+            async with semaphore:
+                value1, value2 = await asyncio.gather(
+                    store1.get(key, prototype=prototype),
+                    store2.get(key, prototype=prototype),
+                )
+            if value1 is None or value2 is None:
+                return value1 is value2
+            return value1.to_bytes() == value2.to_bytes()
+
+        async def all_keys_equal() -> bool:
+            keys1 = {key async for key in store1.list()}
+            keys2 = {key async for key in store2.list()}
+            if keys1 != keys2:
+                return False
+            tasks = [asyncio.ensure_future(key_equal(key)) for key in keys1]
+            try:
+                for task in asyncio.as_completed(tasks):
+                    if not await task:
+                        return False
+            finally:
+                for task in tasks:
+                    task.cancel()
+            return True
+
+        return sync(all_keys_equal())
+
     @staticmethod
     def deep_compare_groups(
         group1: ZarrGroup,
@@ -219,7 +327,7 @@ class _ZarrV3Utils(ZarrUtils):
                     raise ArrayShapeMismatchError(
                         f"Array shapes do not match for key '{key1}': {node1.shape} vs {node2.shape}"
                     )
-                if compare_values and not np.allclose(node1[:], node2[:]):
+                if compare_values and not _ZarrV3Utils.arrays_allclose(node1, node2):
                     raise ArrayValueMismatchError(
                         f"Array values do not match for key '{key1}'"
                     )
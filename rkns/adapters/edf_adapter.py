@@ -1,38 +1,56 @@
 from __future__ import annotations
 
+import os
 import tempfile
-from collections import defaultdict
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from hashlib import md5
+from operator import itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterator
 
 import numpy as np
-import pyedflib
 
-from rkns._zarr import ZarrGroup, add_child_array, get_codec, update_attributes
+from rkns._zarr import (
+    ZarrArray,
+    ZarrGroup,
+    add_child_array,
+    create_child_array,
+    get_codec,
+    update_attributes,
+)
 from rkns.adapters.base import RKNSBaseAdapter
 from rkns.file_formats import FileFormat
-from rkns.util import RKNSNodeNames, get_freq_group
+from rkns.util import RKNSNodeNames, get_freq_group, write_raw_signal
 
 if TYPE_CHECKING:
+    import pyedflib
     from numpy.typing import ArrayLike
 
 
 # TODO: Move this into a separate (external) config
 RAW_CHUNK_SIZE_BYTES = 1024 * 1024 * 8  # 8MB Chunks
+# highest Zstd compression level
+ZSTD_MAX_LEVEL = 22
+SIGNAL_CHUNK_SIZE_BYTES = 1024 * 1024 * 4  # 4MB Chunks
 
 
 # dictionaries mapping the signal header keys to the keys within RKNS
-## These will be added as an additional array of shape (n_channels, len(dictionary)) in /rkns/scaling_array,
+## These will be added as two additional arrays of shape (2, n_channels) in
+## /rkns/signals/fg_*/physical_minmax and /rkns/signals/fg_*/digital_minmax,
 ## as they are seldom requested individually.
+## The digital values are always int16 in EDF, so they are stored separately from
+## the (float) physical values to keep both in their native precision.
+## The float64 array of shape (4, n_channels) in /rkns/signals/fg_*/signal_minmaxs
+## is still written alongside, such that readers of the 0.4.0 layout can read the files.
 ## This will allow a very simple rescaling using numpy broadcasting.
-minmax_array_columnorder = [
-    "physical_min",
-    "physical_max",
-    "digital_min",
-    "digital_max",
-]
+physical_minmax_columnorder = ("physical_min", "physical_max")
+digital_minmax_columnorder = ("digital_min", "digital_max")
+minmax_array_columnorder = [*physical_minmax_columnorder, *digital_minmax_columnorder]
+_physical_minmax_get = itemgetter(*physical_minmax_columnorder)
+_digital_minmax_get = itemgetter(*digital_minmax_columnorder)
 
 ## These will be added as a dictionary within the /rkns attributes,
 ## as this is often of interest for individual channels.
@@ -45,6 +63,7 @@ channel_wise_attribute_text = {
     # I list it here to have a nicer implementation                                                                                                                         below.
     "frequency_group": "frequency_group",
 }
+_channel_items = tuple(channel_wise_attribute_text.items())
 
 
 frequency_group_attributes = {
@@ -67,38 +86,191 @@ header_admininfo_attributes = {
     # I list it here to have a nicer implementation
     "recording_duration_in_s": "recording_duration_in_s",
 }
+# pyedflib header fields that hold datetimes
+_DATETIME_KEYS = frozenset({"startdate", "birthdate"})
 ###########
 
 
 def add_frequency_groups_to_headers(signal_headers: list[dict[str, Any]]) -> None:
     # loop through the pyedf signal headers and pre-compute the frequency groups
-    # based on the sample frequency
-    for i in range(len(signal_headers)):
-        signal_headers[i]["frequency_group"] = get_freq_group(
-            signal_headers[i]["sample_frequency"]
+    # based on the sample frequency (`get_freq_group` is cached per frequency).
+    for s_header in signal_headers:
+        s_header["frequency_group"] = get_freq_group(s_header["sample_frequency"])
+
+
+@contextmanager
+def raw_signal_as_file(raw_signal_node: ZarrArray) -> Iterator[str]:
+    """
+    Provide the content of the raw signal as a file path, e.g. for libraries
+    that can only read from a path.
+
+    On Linux, the bytes are written into an anonymous in-memory file (memfd),
+    avoiding a write to and read from the disk. Otherwise, a named temporary file is used.
+    The file is removed when the context is exited.
+
+    Parameters
+    ----------
+    raw_signal_node
+        The /_raw/signal byte array.
+
+    Yields
+    ------
+        Path to a file with the raw bytes.
+    """
+    if hasattr(os, "memfd_create"):
+        fd = os.memfd_create("rkns_raw_signal")
+        try:
+            with os.fdopen(fd, "wb", closefd=False) as file:
+                write_raw_signal(raw_signal_node, file)
+            yield f"/proc/self/fd/{fd}"
+        finally:
+            os.close(fd)
+    else:
+        with tempfile.NamedTemporaryFile(delete=True) as temp_file:
+            write_raw_signal(raw_signal_node, temp_file)
+            yield temp_file.name
+
+
+def get_signal_chunks(shape: tuple[int, int], itemsize: int) -> tuple[int, int]:
+    """
+    Chunk shape of a (n_samples, n_channels) signal array.
+
+    Each chunk contains all channels of a range of samples and is at most
+    SIGNAL_CHUNK_SIZE_BYTES large, such that reading a time range only decompresses
+    the affected chunks.
+
+    Parameters
+    ----------
+    shape
+        Shape (n_samples, n_channels) of the signal.
+    itemsize
+        Size of a single sample in bytes.
+
+    Returns
+    -------
+        The chunk shape (chunk_samples, n_channels).
+    """
+    n_samples, n_channels = shape
+    max_samples = SIGNAL_CHUNK_SIZE_BYTES // (itemsize * max(n_channels, 1))
+    return (max(1, min(n_samples, max_samples)), n_channels)
+
+
+def _md5_of_buffer(buffer: np.ndarray) -> str:
+    # The md5 is an integrity checksum only, which allows the non-security
+    # (FIPS-exempt) backend. Hashed in blocks to bound the pages touched at once.
+    file_hash = md5(usedforsecurity=False)
+    for start in range(0, buffer.shape[0], RAW_CHUNK_SIZE_BYTES):
+        file_hash.update(memoryview(buffer[start : start + RAW_CHUNK_SIZE_BYTES]))
+    return file_hash.hexdigest()
+
+
+def _iso(pyedf_key: str, attr: Any) -> Any:
+    # datetimes are not JSON-serializable, so they are stored in ISO format.
+    # Only the header fields in _DATETIME_KEYS can hold a datetime
+    # (depending on the pyedflib version, the birthdate might be a string).
+    if pyedf_key in _DATETIME_KEYS and isinstance(attr, datetime):
+        return attr.isoformat()
+    return attr
+
+
+def _check_zstd_level(level: int) -> int:
+    if level > ZSTD_MAX_LEVEL:
+        raise ValueError(
+            f"Zstd compression level must be at most {ZSTD_MAX_LEVEL}, got {level}."
         )
+    return level
+
+
+def _zstd_level_from_env(name: str, default: int) -> int:
+    # read when importing the module, i.e. an invalid value is ignored (with a warning)
+    # instead of failing the import.
+    value = os.environ.get(name, str(default))
+    try:
+        return _check_zstd_level(int(value))
+    except ValueError as e:
+        warnings.warn(f"Ignoring {name}={value!r}, using {default} instead: {e}")
+        return default
 
 
 class RKNSEdfAdapter(RKNSBaseAdapter):
     """RKNS adapter for the EDF format."""
 
+    # Zstd compression level of the signal arrays.
+    # EEG signals compress noticeably better at higher levels at a moderate cost in
+    # write time. Can be set via the environment variable `RKNS_ZSTD_LEVEL` or
+    # `set_compression`, e.g. to use archival levels (19-22) for one-off conversions.
+    zstd_level: int = _zstd_level_from_env("RKNS_ZSTD_LEVEL", 10)
+    # Zstd compression level of the raw file. The interleaved bytes of the raw file
+    # gain little from higher levels, such that a fast level keeps ingestion cheap.
+    # Can be set via the environment variable `RKNS_RAW_ZSTD_LEVEL` or `set_compression`.
+    raw_zstd_level: int = _zstd_level_from_env("RKNS_RAW_ZSTD_LEVEL", 3)
+
+    @classmethod
+    def set_compression(cls, level: int, raw_level: int | None = None) -> None:
+        """
+        Set the Zstd compression levels used for newly written arrays.
+
+        Parameters
+        ----------
+        level
+            Zstd compression level of the signal arrays, at most 22.
+        raw_level
+            Zstd compression level of the raw file, at most 22.
+            By default, the current level is kept.
+        """
+        _check_zstd_level(level)
+        if raw_level is not None:
+            cls.raw_zstd_level = _check_zstd_level(raw_level)
+        cls.zstd_level = level
+
+    @classmethod
+    def _get_compressors(cls, level: int | None = None):
+        # the checksum allows to detect corrupted chunks on decompression.
+        level = cls.zstd_level if level is None else level
+        return get_codec("zstd", level=level, checksum=True)
+
     def _populate_raw_from_file(
         self, file_path: Path, file_format: FileFormat
     ) -> ZarrGroup:
-        # TODO this simply loads the whole chunk into memory.
-        # this should be doable in a more elegant manner using (variable) chunks
-        byte_array = np.fromfile(file_path, dtype=np.byte)
-        add_child_array(
+        # memory-map the file instead of loading it, such that the OS pages in the
+        # bytes on demand while they are compressed chunk by chunk (and hashed).
+        byte_array = np.memmap(file_path, dtype=np.byte, mode="r")
+        raw_signal_node = create_child_array(
             parent_node=self._handler.raw,
-            data=byte_array,
             name=RKNSNodeNames.raw_signal.value,
-            chunks=RAW_CHUNK_SIZE_BYTES,
-            compressors=get_codec("zstd", level=3),
-            attributes={
+            shape=byte_array.shape,
+            dtype=byte_array.dtype,
+            # files smaller than a chunk are stored as a single chunk of their size,
+            # instead of a chunk padded to RAW_CHUNK_SIZE_BYTES.
+            chunks=max(1, min(RAW_CHUNK_SIZE_BYTES, byte_array.shape[0])),
+            compressors=self._get_compressors(level=self.raw_zstd_level),
+        )
+
+        # hashlib and the zstd compression release the GIL, so the file is hashed in a
+        # background thread while the chunks are compressed and written concurrently.
+        # The writes are chunk-aligned, i.e., each one touches a distinct store key.
+        starts = range(0, byte_array.shape[0], RAW_CHUNK_SIZE_BYTES)
+        max_workers = max(1, min(len(starts), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=max_workers + 1) as executor:
+            file_hash = executor.submit(_md5_of_buffer, byte_array)
+            writes = [
+                executor.submit(
+                    raw_signal_node.__setitem__,
+                    slice(start, start + RAW_CHUNK_SIZE_BYTES),
+                    byte_array[start : start + RAW_CHUNK_SIZE_BYTES],
+                )
+                for start in starts
+            ]
+            for write in writes:
+                write.result()
+
+        update_attributes(
+            raw_signal_node,
+            {
                 "filename": file_path.name,
                 "format": file_format.value,
                 "st_mtime": file_path.stat().st_mtime,
-                "md5": md5(byte_array.tobytes()).hexdigest(),
+                "md5": file_hash.result(),
             },
         )
 
@@ -113,62 +285,117 @@ class RKNSEdfAdapter(RKNSBaseAdapter):
         rkns_signals_node = self._handler.signals
         raw_signal_node = self._handler.raw[RKNSNodeNames.raw_signal.value]
 
+        # deferred import, as pyedflib is only needed when parsing the raw EDF.
+        import pyedflib
+
         # TODO: This is just a hacky workaround to use the existing library.
         # We probably need our custom parser..
-        # dump the byte content into a named temporary file and provide the path to pyedflib.
-        with tempfile.NamedTemporaryFile(delete=True) as temp_file:
-            temp_file.write(raw_signal_node[:].tobytes())  # type: ignore
-
-            filepath = temp_file.name
-            channel_data, signal_headers, header = pyedflib.highlevel.read_edf(
-                filepath, digital=True
-            )  # type: ignore
-
-        add_frequency_groups_to_headers(signal_headers)
-
-        fg_arrays, fg_attributes, rkns_attributes = self._extract_data(
-            channel_data, signal_headers, header, validate=validate
-        )
+        # dump the byte content into a (in-memory) file and provide the path to pyedflib.
+        # The channels are read one by one straight into the frequency group signals.
+        with (
+            raw_signal_as_file(raw_signal_node) as filepath,
+            pyedflib.EdfReader(filepath) as reader,
+        ):
+            signal_headers = reader.getSignalHeaders()
+            header = reader.getHeader()
+            add_frequency_groups_to_headers(signal_headers)
+
+            fg_arrays, fg_attributes, rkns_attributes = self._extract_data(
+                reader, signal_headers, header, validate=validate
+            )
         update_attributes(rkns_node, rkns_attributes)
 
+        # the groups are created sequentially, while the arrays of the (independent)
+        # frequency groups are compressed and written concurrently.
+        fg_nodes = []
         for fg in fg_arrays.keys():
             fg_node = rkns_signals_node.create_group(fg)
             update_attributes(fg_node, fg_attributes[fg])
-            add_child_array(
-                parent_node=fg_node,
-                data=fg_arrays[fg]["signal"],
-                name="signal",
-                attributes={"rows": "samples", "columns": "channels"},
-            )
-            add_child_array(
-                parent_node=fg_node,
-                data=fg_arrays[fg]["signal_minmaxs"],
-                name="signal_minmaxs",
-                attributes={"rows": "channels", "columns": minmax_array_columnorder},
+            fg_nodes.append(fg_node)
+
+        max_workers = max(1, min(len(fg_nodes), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # consume the results to propagate exceptions raised within the threads.
+            list(
+                executor.map(self._write_frequency_group, fg_nodes, fg_arrays.values())
             )
 
         return rkns_signals_node
 
+    def _write_frequency_group(
+        self, fg_node: ZarrGroup, fg_array: dict[str, ArrayLike]
+    ) -> None:
+        add_child_array(
+            parent_node=fg_node,
+            data=fg_array["signal"],
+            name="signal",
+            chunks=get_signal_chunks(
+                fg_array["signal"].shape,  # type: ignore
+                fg_array["signal"].dtype.itemsize,  # type: ignore
+            ),
+            compressors=self._get_compressors(),
+            attributes={"rows": "samples", "columns": "channels"},
+        )
+        add_child_array(
+            parent_node=fg_node,
+            data=fg_array["physical_minmax"],
+            name=RKNSNodeNames.rkns_signal_physical_minmax.value,
+            attributes={
+                "rows": list(physical_minmax_columnorder),
+                "columns": "channels",
+            },
+        )
+        add_child_array(
+            parent_node=fg_node,
+            data=fg_array["digital_minmax"],
+            name=RKNSNodeNames.rkns_signal_digital_minmax.value,
+            attributes={
+                "rows": list(digital_minmax_columnorder),
+                "columns": "channels",
+            },
+        )
+        # legacy layout, see `minmax_array_columnorder`
+        add_child_array(
+            parent_node=fg_node,
+            data=fg_array["signal_minmaxs"],
+            name=RKNSNodeNames.rkns_signal_minmaxs.value,
+            attributes={"rows": "channels", "columns": minmax_array_columnorder},
+        )
+
     def _extract_data(
-        self, channel_data, signal_headers, header, validate: bool = True
+        self,
+        reader: pyedflib.EdfReader,
+        signal_headers: list[dict[str, Any]],
+        header: dict[str, Any],
+        validate: bool = True,
     ):
         """
         Helper function to extract the data in a format easily translatable to RKNS.
         """
+        # number of samples per channel, known without reading the signals
+        n_samples_by_channel = reader.getNSamples()
+        if validate:
+            self.validate_consistent_duration(n_samples_by_channel, signal_headers)
+
+        # infer groups based on sample frequency (in order of first occurrence).
+        frequency_groups = dict.fromkeys(
+            s_header["frequency_group"] for s_header in signal_headers
+        )
 
-        # infer groups based on sample frequency.
         # These will identify child arrays of /rkns and contain the actual data.
         # the key specifies the name of the array.
-        fg_arraylist: dict[str, dict[str, list]] = defaultdict(
-            lambda: defaultdict(list)
-        )
-        fg_arrays: dict[str, dict[str, ArrayLike]] = defaultdict(dict)
+        fg_arrays: dict[str, dict[str, ArrayLike]] = {fg: {} for fg in frequency_groups}
+        # indices of the channels (in source order) belonging to each frequency group
+        fg_channel_idxs: dict[str, list[int]] = {fg: [] for fg in frequency_groups}
 
         # will be stored in  /rkns/fg_1.0, /rkns/fg_500.0, ... attributes
-        fg_attributes: dict[str, Any] = defaultdict(lambda: defaultdict(list))
+        fg_attributes: dict[str, Any] = {
+            fg: {rkns_name: [] for rkns_name in frequency_group_attributes.values()}
+            for fg in frequency_groups
+        }
 
         # will be stored in /rkns attributes
-        channel_to_attribute: dict[str, Any] = defaultdict(dict)
+        channel_to_attribute: dict[str, Any] = {}
 
         # iterate over the channels
         # a.) group data by frequency
@@ -178,63 +405,84 @@ class RKNSEdfAdapter(RKNSBaseAdapter):
         for idx, s_header in enumerate(signal_headers):
             fg = s_header["frequency_group"]
             channel = s_header["label"]
+            fg_channel_idxs[fg].append(idx)
 
-            # build signal list for Array /rkns/signal
-            fg_arraylist[fg]["signal"].append(channel_data[idx])
-
-            # build scaling list for Array /rkns/signal_minmaxs
-            p_minmax_d_minmax = [
-                s_header[pyedf_key] for pyedf_key in minmax_array_columnorder
-            ]
-            fg_arraylist[fg]["signal_minmaxs"].append(
-                np.array(p_minmax_d_minmax, dtype=np.float64)
-            )
             # build attributes that are per frequency group
             for pyedf_key, rkns_attribute_name in frequency_group_attributes.items():
                 fg_attributes[fg][rkns_attribute_name].append(s_header[pyedf_key])
             fg_attributes[fg]["sfreq_Hz"] = s_header["sample_frequency"]
 
             # build attributes that are per channel, and will be stored as a dict/JSON in /rkns/
-            for pyedf_key, rkns_attribute_name in channel_wise_attribute_text.items():
-                channel_to_attribute[channel][rkns_attribute_name] = s_header[pyedf_key]
-        for fg in fg_arraylist.keys():
-            fg_arrays[fg]["signal"] = np.stack(
-                fg_arraylist[fg]["signal"], 1, dtype=np.int16
-            )
-            fg_arrays[fg]["signal_minmaxs"] = np.stack(
-                fg_arraylist[fg]["signal_minmaxs"], 1, dtype=np.float64
-            )
+            channel_to_attribute[channel] = {
+                rkns_attribute_name: s_header[pyedf_key]
+                for pyedf_key, rkns_attribute_name in _channel_items
+            }
+
+        # Preallocate the (n_samples, n_channels) signal of each frequency group and
+        # read the channels one by one directly into their columns, such that only a
+        # single channel is held as an intermediate array at any time.
+        # pyedflib returns int32 digital values; the cast to int16 happens within the
+        # copy, so no separate `astype` pass is needed.
+        for fg, channel_idxs in fg_channel_idxs.items():
+            n_samples = n_samples_by_channel[channel_idxs[0]]
+            signal = np.empty((n_samples, len(channel_idxs)), dtype=np.int16)
+            for col, idx in enumerate(channel_idxs):
+                np.copyto(
+                    signal[:, col],
+                    reader.readSignal(idx, digital=True),
+                    casting="same_kind",
+                )
+            fg_arrays[fg]["signal"] = signal
+
+        # gather the scaling values of all channels in bulk, with shape (n_channels, 2),
+        # and split them into the arrays /rkns/signals/fg_*/{physical,digital}_minmax
+        physical_minmax = np.array(
+            [_physical_minmax_get(s_header) for s_header in signal_headers],
+            dtype=np.float32,
+        )
+        digital_minmax = np.array(
+            [_digital_minmax_get(s_header) for s_header in signal_headers],
+            dtype=np.int16,
+        )
+        signal_minmaxs = np.array(
+            [
+                [s_header[pyedf_key] for pyedf_key in minmax_array_columnorder]
+                for s_header in signal_headers
+            ],
+            dtype=np.float64,
+        )
+        for fg, channel_idxs in fg_channel_idxs.items():
+            fg_arrays[fg]["physical_minmax"] = physical_minmax[channel_idxs].T
+            fg_arrays[fg]["digital_minmax"] = digital_minmax[channel_idxs].T
+            fg_arrays[fg]["signal_minmaxs"] = signal_minmaxs[channel_idxs].T
 
         header["recording_duration_in_s"] = (
-            len(channel_data[0]) / signal_headers[0]["sample_frequency"]
+            n_samples_by_channel[0] / signal_headers[0]["sample_frequency"]
         )
-        if validate:
-            self.validate_consistent_duration(channel_data, signal_headers)
-
-        rkns_attributes = dict(patient_info={}, admin_info={})
-        for pyedf_key, rkns_attribute_name in header_patientinfo_attributes.items():
-            attr = header[pyedf_key]
-            if isinstance(attr, datetime):
-                attr = attr.isoformat()
-            rkns_attributes["patient_info"][rkns_attribute_name] = attr
-
-        for pyedf_key, rkns_attribute_name in header_admininfo_attributes.items():
-            attr = header[pyedf_key]
-            if isinstance(attr, datetime):
-                attr = attr.isoformat()
-            rkns_attributes["admin_info"][rkns_attribute_name] = attr
-        rkns_attributes["channel_info"] = dict(channel_to_attribute)
+
+        rkns_attributes = dict(
+            patient_info={
+                rkns_attribute_name: _iso(pyedf_key, header[pyedf_key])
+                for pyedf_key, rkns_attribute_name in header_patientinfo_attributes.items()
+            },
+            admin_info={
+                rkns_attribute_name: _iso(pyedf_key, header[pyedf_key])
+                for pyedf_key, rkns_attribute_name in header_admininfo_attributes.items()
+            },
+        )
+        rkns_attributes["channel_info"] = channel_to_attribute
         return fg_arrays, fg_attributes, rkns_attributes
 
     @classmethod
-    def validate_consistent_duration(cls, channel_data, signal_headers):
-        durations = []
-        for channel_idx in range(len(signal_headers)):
-            n_samples = len(channel_data[channel_idx])
-            durations.append(
-                n_samples / signal_headers[channel_idx]["sample_frequency"]
-            )
-        if not np.all(np.isclose(durations[0], durations)):
+    def validate_consistent_duration(cls, n_samples_by_channel, signal_headers):
+        n_samples = np.asarray(n_samples_by_channel, dtype=np.int64)
+        sample_frequencies = np.fromiter(
+            (s_header["sample_frequency"] for s_header in signal_headers),
+            dtype=np.float64,
+            count=len(signal_headers),
+        )
+        durations = n_samples / sample_frequencies
+        if not np.allclose(durations[0], durations):
             raise ValueError(
                 "Channels in the input file are "
                 + " inconsistent with respect to the duration of the record."
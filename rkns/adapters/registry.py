@@ -21,17 +21,25 @@ class AdapterRegistry:
     # dictionary that keeps track of module paths
     _adapters: dict[FileFormat, str] = dict()
     _raw_writer: dict[FileFormat, str] = dict()
+    # adapters that have already been imported
+    _resolved: dict[FileFormat, Type[RKNSBaseAdapter]] = dict()
 
     @classmethod
     def register_adapter(cls, file_format: FileFormat, adapter_path: str) -> None:
         """Register adapter as a string path to defer import."""
         cls._adapters[file_format] = adapter_path
+        cls._resolved.pop(file_format, None)
 
     @classmethod
     def get_adapter(cls, file_format: FileFormat) -> Type[RKNSBaseAdapter]:
         """Dynamically load the adapter class only when needed."""
+        adapter = cls._resolved.get(file_format)
+        if adapter is not None:
+            return adapter
+
         adapter_path = cls._adapters.get(file_format)
         if not adapter_path:
             raise ValueError(f"No adapter found for file type: {file_format}")
 
-        return import_from_string(adapter_path)
+        adapter = cls._resolved[file_format] = import_from_string(adapter_path)
+        return adapter
@@ -4,12 +4,19 @@ from pathlib import Path
 from typing import Any
 
 from ..file_formats import FileFormat
+from .registry import PREFIX_SIZE_BYTES
+
+# size of the fixed-size part of the EDF header
+EDF_HEADER_SIZE_BYTES = 256
+# the prefix read by the registry has to cover the header, otherwise no file
+# would be detected as EDF.
+assert PREFIX_SIZE_BYTES >= EDF_HEADER_SIZE_BYTES
 
 # if TYPE_CHECKING:
 #     from zarr.storage import StoreLike
 
 
-def detect_format(path: Any | Path | str) -> FileFormat:
+def detect_format(path: Any | Path | str, prefix: bytes | None = None) -> FileFormat:
     """
     If the suffix in lowercase is ".edf", this function detects edf and edf+
     based on the first byte of the file.
@@ -20,6 +27,8 @@ def detect_format(path: Any | Path | str) -> FileFormat:
     ----------
     path
         File of interest.
+    prefix
+        The leading bytes of the file, if already read. Otherwise, the file is opened.
 
     Returns
     -------
@@ -36,11 +45,16 @@ def detect_format(path: Any | Path | str) -> FileFormat:
 
     # Read EDF version from ASCII Character at the beginning of file
     # see https://www.edfplus.info/specs/edf.html
-    with path.open("rb") as file:
-        first_byte = file.read(8)
+    if prefix is None:
+        with path.open("rb") as file:
+            prefix = file.read(EDF_HEADER_SIZE_BYTES)
+
+    # files shorter than the fixed-size part of the header cannot be valid EDFs
+    if len(prefix) < EDF_HEADER_SIZE_BYTES:
+        return FileFormat.UNKNOWN
 
     # Decode the bytes as an ASCII string
-    edf_version = first_byte.decode("ascii").strip()
+    edf_version = prefix[:8].decode("ascii").strip()
     fileformat = {"0": FileFormat.EDF, "1": FileFormat.EDF_PLUS}.get(
         edf_version, FileFormat.UNKNOWN
     )
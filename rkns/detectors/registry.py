@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import inspect
 from collections import OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -11,10 +12,25 @@ from ..file_formats import FileFormat
 if TYPE_CHECKING:
     from typing import Callable
 
-    FileFormatDetector = Callable[[Path | str | Any], FileFormat]
+    # detectors take the path and, optionally, the leading bytes of the file
+    FileFormatDetector = Callable[..., FileFormat]
 
 
-__all__ = ["FileFormatRegistry"]
+# Number of leading bytes of a file provided to the detectors.
+# Corresponds to the fixed-size part of the EDF header.
+PREFIX_SIZE_BYTES = 256
+
+
+__all__ = ["FileFormatRegistry", "PREFIX_SIZE_BYTES"]
+
+
+def _accepts_prefix(detector_fn: Callable) -> bool:
+    """Whether the detector can be called as `detector_fn(file_path, prefix)`."""
+    try:
+        inspect.signature(detector_fn).bind(None, None)
+    except (TypeError, ValueError):
+        return False
+    return True
 
 
 class FileFormatRegistry:
@@ -30,12 +46,21 @@ class FileFormatRegistry:
     """
 
     _detector_fn_path: OrderedDict[FileFormat, str] = OrderedDict()
+    # detector functions that have already been imported
+    _resolved: dict[FileFormat, FileFormatDetector] = dict()
+    # whether the resolved detectors take the file prefix as second argument
+    _resolved_accepts_prefix: dict[FileFormat, bool] = dict()
 
     @classmethod
     def register_detector(cls, format_name: FileFormat, detector_fn_path: str) -> None:
         """
         Register a function via its dotted path.
 
+        The function is called as `detector_fn(file_path, prefix)` with the first
+        PREFIX_SIZE_BYTES bytes of the file (or None if it is not a file), if its
+        signature accepts a second argument. Otherwise, it is called as
+        `detector_fn(file_path)`.
+
         Parameters
         ----------
         format_name
@@ -44,13 +69,15 @@ class FileFormatRegistry:
             Absolute path to the function.
         """
         cls._detector_fn_path[format_name] = detector_fn_path
+        cls._resolved.pop(format_name, None)
+        cls._resolved_accepts_prefix.pop(format_name, None)
 
     @classmethod
     def get_detector(cls, format_name: FileFormat) -> FileFormatDetector:
         """
         Dynamically load the detector function based on the format name.
 
-        Note: This function might not be needed..
+        The imported function is cached, such that repeated lookups are cheap.
 
         Parameters
         ----------
@@ -66,11 +93,18 @@ class FileFormatRegistry:
         ValueError
             _description_
         """
+        detector_fn = cls._resolved.get(format_name)
+        if detector_fn is not None:
+            return detector_fn
+
         detector_path = cls._detector_fn_path.get(format_name)
         if not detector_path:
             raise ValueError(f"No detector found for {format_name=}")
 
-        return import_from_string(detector_path)
+        detector_fn = import_from_string(detector_path)
+        cls._resolved_accepts_prefix[format_name] = _accepts_prefix(detector_fn)
+        cls._resolved[format_name] = detector_fn
+        return detector_fn
 
     @classmethod
     def detect_fileformat(cls, file_path: Path | str | Any) -> FileFormat:
@@ -88,12 +122,19 @@ class FileFormatRegistry:
             An Enum identifying the detected format, e.g. "EDF".
             Returns FileFormat.UNKNOWN if the format could not be detected.
         """
+        # read the beginning of the file only once, instead of in each detector.
+        prefix = None
+        if isinstance(file_path, (Path, str)) and Path(file_path).is_file():
+            with open(file_path, "rb") as file:
+                prefix = file.read(PREFIX_SIZE_BYTES)
+
         detected_format = FileFormat.UNKNOWN
-        for format_name, detector_fn_dotted_path in cls._detector_fn_path.items():
-            detector_fn: FileFormatDetector = import_from_string(
-                detector_fn_dotted_path
-            )
-            detected_format = detector_fn(file_path)
+        for format_name in cls._detector_fn_path.keys():
+            detector_fn = cls.get_detector(format_name)
+            if cls._resolved_accepts_prefix[format_name]:
+                detected_format = detector_fn(file_path, prefix)
+            else:
+                detected_format = detector_fn(file_path)
             if detected_format != FileFormat.UNKNOWN:
                 return detected_format
         return detected_format
@@ -6,7 +6,7 @@ from typing import Any
 from ..file_formats import FileFormat
 
 
-def detect_format(path: str | Path | Any) -> FileFormat:
+def detect_format(path: str | Path | Any, prefix: bytes | None = None) -> FileFormat:
     """
     If the suffix in lowercase is ".edf", this function detects edf and edf+
     based on the first byte of the file.
@@ -17,6 +17,8 @@ def detect_format(path: str | Path | Any) -> FileFormat:
     ----------
     path
         File of interest.
+    prefix
+        The leading bytes of the file. Not used, as the detection is based on the suffix.
 
     Returns
     -------
@@ -1,10 +1,31 @@
-from typing import Any, Tuple, TypeVar, Union, cast
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Hashable, Tuple, TypeVar, Union
 
 import numpy as np
 
-from ._zarr import ZarrArray
+if TYPE_CHECKING:
+    # zarr is only needed for annotations; keep ``rkns.lazy`` importable
+    # without pulling in the zarr stack.
+    from ._zarr import ZarrArray
+
+T = TypeVar("T", bound=Union["ZarrArray", np.ndarray])
+
+# max. number of sliced parameters cached per LazySignal
+_PARAM_CACHE_SIZE = 64
 
-T = TypeVar("T", bound=Union[ZarrArray, np.ndarray])
+
+def _index_key(idx: Any) -> Hashable:
+    """
+    Hashable representation of an index, as slices and arrays are not hashable.
+    """
+    if isinstance(idx, slice):
+        return (slice, idx.start, idx.stop, idx.step)
+    elif isinstance(idx, (tuple, list)):
+        return (type(idx), *(_index_key(i) for i in idx))
+    elif isinstance(idx, np.ndarray):
+        return (np.ndarray, idx.dtype.str, idx.shape, idx.tobytes())
+    return (type(idx), idx)
 
 
 class LazySignal:
@@ -27,13 +48,29 @@ class LazySignal:
         source : ZarrArray or np.ndarray
             The underlying data array to be transformed.
         _m : np.ndarray
-            Scaling factors of shape (1, n_channels).
+            Scaling factors of shape (1, n_channels). Stored as float32.
         _bias : np.ndarray
-            Bias terms of shape (1, n_channels).
+            Bias terms of shape (1, n_channels). Stored as float32.
         """
         self._source = source
-        self._m = _m
-        self._bias = _bias
+        # the parameters are kept in float32, such that the (typically int16) signals
+        # are transformed to float32 instead of float64, halving the memory traffic.
+        self._m = np.asarray(_m, dtype=np.float32)
+        self._bias = np.asarray(_bias, dtype=np.float32)
+        # the transform _m * (x + _bias) is evaluated as x * _m + _c. The offset is
+        # computed from the float64 parameters and rounded to float32 only once.
+        self._c = (
+            np.asarray(_m, dtype=np.float64) * np.asarray(_bias, dtype=np.float64)
+        ).astype(np.float32)
+        # 1D views of shape (n_channels,), to select single channels or rows
+        # without 2D fancy indexing.
+        self._m1d = self._m.ravel()
+        self._c1d = self._c.ravel()
+        # digital and physical ranges coincide for all channels, i.e., the transform
+        # reduces to a dtype cast.
+        self._identity = bool(np.all(self._m == 1) and np.all(self._c == 0))
+        # sliced parameters by index, see `slice_columns_param`
+        self._param_cache: dict[Hashable, Tuple[np.ndarray, np.ndarray]] = {}
 
         if len(self._m.shape) != 2 or self._m.shape[1] != source.shape[1]:
             raise ValueError(
@@ -59,9 +96,59 @@ class LazySignal:
         np.ndarray
             The transformed data corresponding to the requested slice.
         """
-        source_sliced = cast(np.ndarray, self._source.__getitem__(idx))
+        if self._identity:
+            return np.asarray(self._source[idx], dtype=self.dtype)
+
+        if self.is_full_index(idx):
+            # fast path for reading the whole signal: parameters need no slicing.
+            transformed = np.multiply(self._source[:], self._m)
+            return np.add(transformed, self._c, out=transformed)
+
+        source_sliced: np.ndarray = self._source[idx]  # type: ignore
         return self._transform(source_sliced, idx)
 
+    def read_into(
+        self, idx: Union[int, slice, Tuple, np.ndarray], out: np.ndarray
+    ) -> np.ndarray:
+        """
+        Write the transformed data for the given index into a preallocated buffer.
+
+        Allows streaming consumers, e.g. reading fixed-size windows, to reuse a
+        single output buffer instead of allocating one per read.
+
+        Parameters
+        ----------
+        idx : int, slice, tuple, or np.ndarray
+            The index or slice to apply to the data.
+        out : np.ndarray
+            Buffer of the shape of the selection, with a floating dtype.
+
+        Returns
+        -------
+        np.ndarray
+            The buffer `out`, holding the transformed data.
+
+        Raises
+        ------
+        ValueError
+            If the shape of `out` does not match the selection.
+        """
+        source_sliced: np.ndarray = self._source[idx]  # type: ignore
+        if np.shape(source_sliced) != out.shape:
+            raise ValueError(
+                f"Shape of out {out.shape} does not match the selection {np.shape(source_sliced)}."
+            )
+        if self._identity:
+            np.copyto(out, source_sliced)
+            return out
+
+        if self.is_full_index(idx):
+            _m, _c = self._m, self._c
+        else:
+            _m, _c = self.slice_columns_param(idx)
+        np.multiply(source_sliced, _m, out=out)
+        return np.add(out, _c, out=out)
+
     @property
     def shape(self) -> Tuple[int, ...]:
         """
@@ -150,7 +237,7 @@ class LazySignal:
 
     def slice_columns_param(self, idx) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Slice the scaling and bias parameters based on indexing.
+        Slice the scaling and offset parameters based on indexing.
 
         Handles slicing of parameters to match the data indexing pattern.
 
@@ -162,31 +249,62 @@ class LazySignal:
         Returns
         -------
         Tuple[np.ndarray, np.ndarray]
-            The sliced scaling (_m) and bias (_bias) parameters.
-        """
-        if isinstance(idx, int) or isinstance(idx, slice):
-            return self._m, self._bias
-        elif isinstance(idx, tuple):
-            if len(idx) > 2:
-                raise IndexError("Too many indices for 2D array")
-            elif len(idx) == 1:
-                return self._m, self._bias
-            row, col = idx  # type: ignore
-            if row is ...:
-                row = slice(None)
-            if col is ...:
-                col = slice(None)
-
-            if isinstance(row, int) and isinstance(col, int):
-                return self._m[0, col], self._bias[0, col]
-            elif isinstance(row, int):
-                return self._m[0, col], self._bias[0, col]
-            elif isinstance(col, int):
-                return self._m[:, col], self._bias[:, col]
-            else:
-                return self._m[:, col], self._bias[:, col]
+            The sliced scaling (_m) and offset (_c = _m * _bias) parameters.
+        """
+        # the sliced parameters are cached, as e.g. windowed reads repeatedly
+        # use the same column index.
+        try:
+            key = _index_key(idx)
+            params = self._param_cache.get(key)
+        except TypeError:  # unhashable index
+            return self._slice_columns_param(idx)
+
+        if params is None:
+            params = self._slice_columns_param(idx)
+            if len(self._param_cache) >= _PARAM_CACHE_SIZE:
+                # evict the oldest entry
+                del self._param_cache[next(iter(self._param_cache))]
+            self._param_cache[key] = params
+        return params
+
+    def _slice_columns_param(self, idx) -> Tuple[np.ndarray, np.ndarray]:
+        # dispatch on the exact type first, as this is the common case.
+        slicer = self._param_slicers.get(type(idx))
+        if slicer is None:
+            # subclasses, e.g. of int or tuple
+            slicer = next(
+                (f for t, f in self._param_slicers.items() if isinstance(idx, t)), None
+            )
+            if slicer is None:
+                raise TypeError("Invalid index type")
+        return slicer(self, idx)
+
+    def _params_all_columns(self, idx) -> Tuple[np.ndarray, np.ndarray]:
+        return self._m, self._c
+
+    def _params_tuple(self, idx) -> Tuple[np.ndarray, np.ndarray]:
+        if len(idx) > 2:
+            raise IndexError("Too many indices for 2D array")
+        elif len(idx) == 1:
+            return self._m, self._c
+        row, col = idx  # type: ignore
+        if row is ...:
+            row = slice(None)
+        if col is ...:
+            col = slice(None)
+
+        if isinstance(row, int) or isinstance(col, int):
+            # the result is 1D (or a scalar), i.e. the parameters are as well.
+            return self._m1d[col], self._c1d[col]
         else:
-            raise TypeError("Invalid index type")
+            return self._m[:, col], self._c[:, col]
+
+    # functions slicing the parameters, by type of the index
+    _param_slicers = {
+        int: _params_all_columns,
+        slice: _params_all_columns,
+        tuple: _params_tuple,
+    }
 
     @staticmethod
     def is_full_slice(s: Union[slice, int, None]) -> bool:
@@ -207,6 +325,30 @@ class LazySignal:
             return s.start is None and s.stop is None and s.step is None
         return False
 
+    @classmethod
+    def is_full_index(cls, idx: Any) -> bool:
+        """
+        Check if an index selects the whole (2D) array, e.g. [:], [...] or [:, :].
+
+        Parameters
+        ----------
+        idx : int, slice, tuple, or np.ndarray
+            The index to check.
+
+        Returns
+        -------
+        bool
+            True if the index covers the entire array, False otherwise.
+        """
+        if idx is ... or cls.is_full_slice(idx):
+            return True
+        if isinstance(idx, tuple) and 0 < len(idx) <= 2:
+            n_ellipsis = sum(i is ... for i in idx)
+            return n_ellipsis <= 1 and all(
+                i is ... or cls.is_full_slice(i) for i in idx
+            )
+        return False
+
     def _transform(
         self, data_slice: np.ndarray, idx: Union[int, slice, Tuple, np.ndarray]
     ) -> np.ndarray:
@@ -215,7 +357,7 @@ class LazySignal:
 
         Parameters
         ----------
-        chunk : np.ndarray
+        data_slice : np.ndarray
             The data chunk to transform.
         idx : int, slice, tuple, or np.ndarray
             The index or slice used to retrieve the chunk.
@@ -225,5 +367,13 @@ class LazySignal:
         np.ndarray
             The transformed data chunk.
         """
-        _m, _bias = self.slice_columns_param(idx)
-        return _m * (data_slice + _bias)
+        if self._identity:
+            return np.asarray(data_slice, dtype=self.dtype)
+
+        _m, _c = self.slice_columns_param(idx)
+        # the product allocates the (float) output, which is then shifted in-place to
+        # avoid a second temporary of the size of the data slice.
+        transformed = np.multiply(data_slice, _m)
+        if isinstance(transformed, np.ndarray):
+            return np.add(transformed, _c, out=transformed)
+        return transformed + _c
@@ -2,14 +2,15 @@ from __future__ import annotations
 
 import datetime
 import logging
+import tempfile
 import warnings
 from pathlib import Path
-from types import EllipsisType
-from typing import TYPE_CHECKING, Any, Iterable, Optional, OrderedDict, cast
+from types import EllipsisType, MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, Optional, cast
 
 import numpy as np
 
-from rkns._zarr import StoreHandler, ZarrArray
+from rkns._zarr import StoreHandler, ZarrArray, ZarrGroup, get_or_create_target_store
 from rkns._zarr.types import JSON
 from rkns.adapters.base import RKNSBaseAdapter
 from rkns.adapters.registry import AdapterRegistry
@@ -22,11 +23,16 @@ from rkns.util import (
     apply_check_open_to_all_methods,
     check_validity,
     get_freq_group,
+    write_raw_signal,
 )
 from rkns.version import __version__
 
 logger = logging.getLogger(__name__)
 
+# external files of at least this size are ingested into a temporary directory store
+# instead of a memory store, if no target store is given.
+MEMORY_STORE_MAX_FILE_SIZE_BYTES = 256 * 1024 * 1024
+
 
 if TYPE_CHECKING:
     from typing import Self
@@ -39,33 +45,89 @@ class RKNS:
     """The RKNS class represents a single ExG record of a subject.
     Data is always a Zarr store."""
 
+    # helpers of get_signal, which is itself checked for the object being closed.
+    _skip_check_open = frozenset(
+        {
+            "_resolve_signal_selection",
+            "_RKNS__build_row_idx_from_timerange",
+            "_RKNS__build_col_idx_from_channels",
+            "_get_signal_by_fg",
+            "_get_fg_attrs",
+            "_get_fg_node",
+            "_get_frequencygroup",
+            "_get_channel_indices",
+        }
+    )
+
     def __init__(self, store_handler: StoreHandler, adapter: RKNSBaseAdapter) -> None:
         self.handler = store_handler
         self._is_closed = False
 
         self.adapter = adapter
 
+        # attributes of /rkns and of the frequency groups are read once from the store,
+        # as every access would otherwise decode the JSON metadata again.
+        self._rkns_attrs: dict[str, Any] | None = None
+        self._fg_attrs: dict[str, dict[str, Any]] = {}
+        # the names of the frequency groups, and the group and signal array of each.
+        self._frequency_groups: list[str] | None = None
+        self._fg_nodes: dict[str, ZarrGroup] = {}
+        self._digital_signals: dict[str, ZarrArray] = {}
+        # the LazySignal of each frequency group, holding its scaling parameters.
+        self._lazy_signals: dict[str, LazySignal] = {}
+        # mapping from channel name to column index, by frequency group.
+        self._channel_indices: dict[str, dict[str, int]] = {}
+
+    def _get_rkns_attrs(self) -> dict[str, Any]:
+        if self._rkns_attrs is None:
+            self._rkns_attrs = self.handler.rkns.attrs.asdict()
+        return self._rkns_attrs
+
+    def _get_fg_attrs(self, frequency_group: str) -> dict[str, Any]:
+        fg_attrs = self._fg_attrs.get(frequency_group)
+        if fg_attrs is None:
+            fg_attrs = self._get_fg_node(frequency_group).attrs.asdict()
+            self._fg_attrs[frequency_group] = fg_attrs
+        return fg_attrs
+
+    def _get_fg_node(self, frequency_group: str) -> ZarrGroup:
+        fg_node = self._fg_nodes.get(frequency_group)
+        if fg_node is None:
+            fg_node = cast(ZarrGroup, self.handler.signals[frequency_group])
+            self._fg_nodes[frequency_group] = fg_node
+        return fg_node
+
+    def _clear_caches(self) -> None:
+        """Drop the cached attributes and nodes, e.g. after (re-)populating /rkns."""
+        self._rkns_attrs = None
+        self._fg_attrs.clear()
+        self._frequency_groups = None
+        self._fg_nodes.clear()
+        self._digital_signals.clear()
+        self._lazy_signals.clear()
+        self._channel_indices.clear()
+
     @property
     def patient_info(self) -> JSON:
-        return self.handler.rkns.attrs["patient_info"]
+        return self._get_rkns_attrs()["patient_info"]
 
     @property
     def admin_info(self) -> JSON:
-        return self.handler.rkns.attrs["admin_info"]
+        return self._get_rkns_attrs()["admin_info"]
 
     @property
     def channel_info(self) -> JSON:
-        return self.handler.rkns.attrs["channel_info"]
+        return self._get_rkns_attrs()["channel_info"]
 
     def get_channel_names(self) -> list[str]:
-        return [k for k in self.channel_info.keys()]  # type: ignore
+        return list(self.channel_info)  # type: ignore
 
     def _get_channel_names_by_fg(self, frequency_group: str) -> list[str]:
-        return self.handler.signals[frequency_group].attrs["channels"]  # type: ignore
+        return self._get_fg_attrs(frequency_group)["channels"]
 
     def get_frequency_by_channel(self, channel_name: str) -> float:
         fg = self._get_frequencygroup(channel_name)
-        return cast(float, self.handler.signals[fg].attrs["sfreq_Hz"])
+        return cast(float, self._get_fg_attrs(fg)["sfreq_Hz"])
 
     def _get_signal_by_freq(self, frequency: float) -> LazySignal:
         return self._get_signal_by_fg(get_freq_group(frequency))
@@ -75,6 +137,8 @@ class RKNS:
         channels: str | Iterable[str] | None = None,
         sfreq_Hz: float | None = None,
         time_range: tuple[float, float] = (0, np.inf),
+        snap_to_chunks: bool = False,
+        out: np.ndarray | None = None,
     ) -> np.ndarray:
         """Get signal data for specified channels or frequency group.
 
@@ -87,17 +151,88 @@ class RKNS:
         time_range : tuple[float, float], optional
             Time range in seconds to retrieve, by default (0, inf), i.e. the whole time frame.
             The time is with respect to the record duration.
+        snap_to_chunks : bool, optional
+            Whether to extend the time range to the boundaries of the stored chunks,
+            by default False. As chunks are always decompressed as a whole, this
+            returns the additional samples at no extra decompression cost.
+        out : np.ndarray, optional
+            Preallocated floating point buffer of the shape of the selection, which
+            the signal is written into instead of allocating a new array.
 
         Returns
         -------
-            Signal data array for the specified parameters.
+            Signal data array for the specified parameters, i.e. `out` if given.
 
         Raises
         ------
         ValueError
             If both channels and frequency are specified, or neither is specified.
             If specified channels belong to different frequency groups.
+            If `out` does not match the shape of the selection.
+        """
+        signal, row_idx, col_idx = self._resolve_signal_selection(
+            channels=channels,
+            sfreq_Hz=sfreq_Hz,
+            time_range=time_range,
+            snap_to_chunks=snap_to_chunks,
+        )
+        return self._read_selection(signal, row_idx, col_idx, out=out)
+
+    def compile_getter(
+        self,
+        channels: str | Iterable[str] | None = None,
+        sfreq_Hz: float | None = None,
+        time_range: tuple[float, float] = (0, np.inf),
+        snap_to_chunks: bool = False,
+    ) -> Callable[..., np.ndarray]:
+        """Resolve a fixed `get_signal` query once and return a reusable reader for it.
+
+        The channel lookup, the frequency group and the row and column indices are
+        computed here, so each call of the returned function only reads the signal.
+        As the methods of the RKNS object, the returned function raises once the RKNS
+        object has been closed.
+
+        Parameters
+        ----------
+        channels
+            Channel name(s) to retrieve. Mutually exclusive with `sfreq_Hz`.
+        sfreq_Hz
+            Sampling frequency in Hz to retrieve. Mutually exclusive with `channels`.
+        time_range : tuple[float, float], optional
+            Time range in seconds to retrieve, by default (0, inf).
+        snap_to_chunks : bool, optional
+            Whether to extend the time range to the chunk boundaries, by default False.
+
+        Returns
+        -------
+            Function returning the same data as `get_signal` with the given parameters.
+            It optionally takes a preallocated buffer `out`, as `get_signal`.
         """
+        signal, row_idx, col_idx = self._resolve_signal_selection(
+            channels=channels,
+            sfreq_Hz=sfreq_Hz,
+            time_range=time_range,
+            snap_to_chunks=snap_to_chunks,
+        )
+        read_selection = self._read_selection
+
+        def getter(out: np.ndarray | None = None) -> np.ndarray:
+            if self._is_closed:
+                raise RuntimeError(
+                    "Cannot execute compile_getter getter: RKNS object has been closed"
+                )
+            return read_selection(signal, row_idx, col_idx, out=out)
+
+        return getter
+
+    def _resolve_signal_selection(
+        self,
+        channels: str | Iterable[str] | None,
+        sfreq_Hz: float | None,
+        time_range: tuple[float, float],
+        snap_to_chunks: bool,
+    ) -> tuple[LazySignal, slice, np.ndarray | slice | EllipsisType]:
+        """Resolve the parameters of `get_signal` to a signal and its row and column index."""
         if channels is not None and sfreq_Hz is not None:
             raise ValueError("Specify either channels or frequency, not both.")
         elif channels is None and sfreq_Hz is None:
@@ -108,13 +243,21 @@ class RKNS:
 
         elif channels is not None and sfreq_Hz is None:
             if isinstance(channels, str):
+                # a single channel trivially belongs to a single frequency group.
+                fg = self._get_frequencygroup(channels)
                 channels = [channels]
-
-            fgs = {self._get_frequencygroup(c) for c in channels}
-            if len(fgs) != 1:
-                raise ValueError("Channels must belong to the same frequency group.")
-            fg = next(iter(fgs))
-            sfreq_Hz = cast(float, self.handler.signals[fg].attrs["sfreq_Hz"])
+            else:
+                # one lookup of the (cached) channel info, instead of one per channel.
+                channel_info = cast(dict, self.channel_info)
+                channels = list(channels)
+                if not channels:
+                    raise ValueError("Specify at least one channel.")
+                fg = channel_info[channels[0]]["frequency_group"]
+                if any(channel_info[c]["frequency_group"] != fg for c in channels):
+                    raise ValueError(
+                        "Channels must belong to the same frequency group."
+                    )
+            sfreq_Hz = cast(float, self._get_fg_attrs(fg)["sfreq_Hz"])
         else:
             # Unnecessary but helps pylance.
             raise RuntimeError("Unreachable code reached..")
@@ -122,10 +265,31 @@ class RKNS:
         row_idx = self.__build_row_idx_from_timerange(
             sfreq_Hz=sfreq_Hz, time_range=time_range
         )
+        if snap_to_chunks and row_idx != slice(None):
+            n = self.get_samples_per_chunk(frequency_group=fg)
+            row_idx = slice(row_idx.start // n * n, -(-row_idx.stop // n) * n)
         col_idx = self.__build_col_idx_from_channels(
             channels=channels, frequency_group=fg
         )
-        return self._get_signal_by_fg(fg)[row_idx, col_idx]
+        return self._get_signal_by_fg(fg), row_idx, col_idx
+
+    @staticmethod
+    def _read_selection(
+        signal: LazySignal,
+        row_idx: slice,
+        col_idx: np.ndarray | slice | EllipsisType,
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        if out is not None:
+            return signal.read_into((row_idx, col_idx), out)
+        if isinstance(col_idx, np.ndarray):
+            # each chunk holds all channels, so zarr decodes the same chunks either way.
+            # Reading the spanned columns as a basic selection and picking the channels
+            # in memory is faster than zarr's orthogonal (gather) indexing.
+            start = int(col_idx.min())
+            spanned = signal[row_idx, start : int(col_idx.max()) + 1]
+            return spanned[:, col_idx - start]
+        return signal[row_idx, col_idx]
 
     def __build_row_idx_from_timerange(
         self,
@@ -152,6 +316,11 @@ class RKNS:
         ValueError
             If the end time is not larger than the start time.
         """
+        start, stop = time_range
+        if (start is None or start == 0) and (stop is None or stop == np.inf):
+            # the whole recording, which needs neither the duration nor a bounded slice.
+            return slice(None)
+
         if time_range[0] is None:
             time_range[0] = 0
 
@@ -165,15 +334,20 @@ class RKNS:
             )
 
         start_idx = int(time_range[0] * sfreq_Hz)
-        end_time = min(time_range[0] + self.get_recording_duration(), time_range[1])
+        if np.isinf(time_range[1]):
+            end_time = time_range[0] + self.get_recording_duration()
+        else:
+            # slicing clips a finite end beyond the recording, no need for the duration.
+            end_time = time_range[1]
         end_idx = int(end_time * sfreq_Hz)
         return slice(start_idx, end_idx)
 
     def __build_col_idx_from_channels(
         self, channels: Iterable[str] | None, frequency_group: str
-    ) -> list[int] | EllipsisType:
+    ) -> np.ndarray | slice | EllipsisType:
         """
         Convert channel names to their corresponding column indices for a given frequency group.
+        Consecutive columns are selected by a slice instead, which zarr reads without a gather.
 
         Parameters
         ----------
@@ -185,27 +359,45 @@ class RKNS:
 
         Returns
         -------
-            List of column indices corresponding to the given channels, or `...` if no channels are specified.
+            Array of column indices corresponding to the given channels, a slice if these
+            are consecutive, or `...` if no channels are specified.
         """
         if channels is None:
             return ...
-        channel_to_index = self.get_channel_order(frequency_group=frequency_group)
-        index_order = [channel_to_index[channel] for channel in channels]
+        channel_to_index = self._get_channel_indices(frequency_group)
+        index_order = np.fromiter(
+            (channel_to_index[channel] for channel in channels), dtype=np.intp
+        )
+        start = int(index_order[0])
+        if (np.diff(index_order) == 1).all():
+            return slice(start, start + len(index_order))
         return index_order
 
+    def _get_channel_indices(self, frequency_group: str) -> dict[str, int]:
+        channel_to_index = self._channel_indices.get(frequency_group)
+        if channel_to_index is None:
+            channel_to_index = {
+                channel: idx
+                for idx, channel in enumerate(
+                    self._get_channel_names_by_fg(frequency_group)
+                )
+            }
+            self._channel_indices[frequency_group] = channel_to_index
+        return channel_to_index
+
     def get_channel_order(
         self, frequency_group: str | None = None, sfreq_in_Hz: float | None = None
-    ) -> OrderedDict[str, int]:
+    ) -> Mapping[str, int]:
         """
         Get the order in which the channels are stored for a given frequency (in Hz) or frequency group.
-        Return an ordered dictionary, with the items corresponding to the channel names,
+        Return a read-only ordered mapping, with the items corresponding to the channel names,
         and the values correspond to their column index in the underlying zarr store.
         This order corresponds to the one you obtain when querying ALL channels of a group with `get_signal`.
 
         Note that channels are always grouped with other channels of similar frequency.
 
         The order of the items corresponds to the index.
-        E.g. the returned OrderedDict could look like {"F1":0, "F2": 1, "F3":2, ...}
+        E.g. the returned mapping could look like {"F1":0, "F2": 1, "F3":2, ...}
 
         Parameters
         ----------
@@ -216,7 +408,7 @@ class RKNS:
 
         Returns
         -------
-            An OrderedDict mapping the channel name to its column index in the stored array.
+            A read-only mapping of the channel name to its column index in the stored array.
 
         """
         if frequency_group is not None and sfreq_in_Hz is not None:
@@ -227,11 +419,24 @@ class RKNS:
             frequency_group = get_freq_group(freq_in_Hz=sfreq_in_Hz)
         else:
             frequency_group = cast(str, frequency_group)
-        channel_names_ordered = self.handler.get_channels_by_fg(frequency_group)
-        channel_to_index = OrderedDict(
-            (item, idx) for idx, item in enumerate(channel_names_ordered)
-        )
-        return channel_to_index
+        return MappingProxyType(self._get_channel_indices(frequency_group))
+
+    def get_samples_per_chunk(self, frequency_group: str) -> int:
+        """
+        Return the number of samples (rows) per stored chunk of a frequency group.
+
+        Reads within these boundaries only decompress a single chunk.
+
+        Parameters
+        ----------
+        frequency_group
+            The frequency group of the signal.
+
+        Returns
+        -------
+            Number of samples along the time axis of each chunk.
+        """
+        return self._get_digital_signal_by_fg(frequency_group).chunks[0]
 
     def get_recording_duration(self) -> float:
         """
@@ -247,32 +452,60 @@ class RKNS:
         return datetime.datetime.fromisoformat(self.admin_info["recording_date"])  # type: ignore
 
     def _get_signal_by_fg(self, frequency_group: str) -> LazySignal:
+        # the scaling parameters are derived once per frequency group.
+        l_signal = self._lazy_signals.get(frequency_group)
+        if l_signal is None:
+            l_signal = self._load_signal_by_fg(frequency_group)
+            self._lazy_signals[frequency_group] = l_signal
+        return l_signal
+
+    def _load_signal_by_fg(self, frequency_group: str) -> LazySignal:
         digital_signal = self._get_digital_signal_by_fg(frequency_group=frequency_group)
         pminmax_dminmax = self._pminmax_dminmax_by_fg(frequency_group=frequency_group)
 
+        # rows as (1, n_channels) views, instead of copies by fancy indexing.
+        pmin, pmax, dmin, dmax = (pminmax_dminmax[i : i + 1] for i in range(4))
         l_signal = LazySignal.from_minmaxs(
-            digital_signal,
-            pmin=cast(np.ndarray, pminmax_dminmax[[0]]),
-            pmax=cast(np.ndarray, pminmax_dminmax[[1]]),
-            dmin=cast(np.ndarray, pminmax_dminmax[[2]]),
-            dmax=cast(np.ndarray, pminmax_dminmax[[3]]),
+            digital_signal, pmin=pmin, pmax=pmax, dmin=dmin, dmax=dmax
         )
         return l_signal
 
     def _get_digital_signal_by_fg(self, frequency_group: str) -> ZarrArray:
-        return self.handler.signals[frequency_group][RKNSNodeNames.rkns_signal.value]  # type: ignore
-
-    def _pminmax_dminmax_by_fg(self, frequency_group: str) -> ZarrArray:
-        return self.handler.signals[frequency_group][
-            RKNSNodeNames.rkns_signal_minmaxs.value
-        ]  # type: ignore
+        digital_signal = self._digital_signals.get(frequency_group)
+        if digital_signal is None:
+            fg_node = self._get_fg_node(frequency_group)
+            digital_signal = cast(ZarrArray, fg_node[RKNSNodeNames.rkns_signal.value])
+            self._digital_signals[frequency_group] = digital_signal
+        return digital_signal
+
+    def _pminmax_dminmax_by_fg(self, frequency_group: str) -> np.ndarray:
+        """
+        Return the physical and digital min/max values of a frequency group as a
+        single float64 array of shape (4, n_channels), with rows ordered as
+        (physical_min, physical_max, digital_min, digital_max).
+        """
+        fg_node = self._get_fg_node(frequency_group)
+        if RKNSNodeNames.rkns_signal_minmaxs.value in fg_node:
+            # the (4, n_channels) array of the legacy layout, which holds the
+            # original float64 values.
+            legacy = fg_node[RKNSNodeNames.rkns_signal_minmaxs.value]
+            return np.asarray(legacy[:], dtype=np.float64)  # type: ignore
+        physical_minmax = fg_node[RKNSNodeNames.rkns_signal_physical_minmax.value]
+        digital_minmax = fg_node[RKNSNodeNames.rkns_signal_digital_minmax.value]
+        return np.concatenate(
+            [physical_minmax[:], digital_minmax[:]],  # type: ignore
+            axis=0,
+            dtype=np.float64,
+        )
 
     def _get_frequencygroup(self, channel_name: str) -> str:
         # attributes of the /rkns contain the mapping from channel_name to frequency_group
         return self.channel_info[channel_name]["frequency_group"]  # type: ignore
 
     def _get_frequencygroups(self) -> list[str]:
-        return [k for k in self.handler.signals.keys()]
+        if self._frequency_groups is None:
+            self._frequency_groups = list(self.handler.signals.keys())
+        return list(self._frequency_groups)
 
     def is_equal_to(
         self,
@@ -280,18 +513,22 @@ class RKNS:
         max_depth: Optional[int] = None,
         compare_values: bool = True,
         compare_attributes: bool = True,
+        byte_identical_ok: bool = False,
     ) -> bool:
+        # byte_identical_ok first compares the raw bytes of both stores, which is
+        # faster for e.g. exports, but reads both stores twice if they differ.
         return self.handler.deep_compare(
             other.handler,
             max_depth=max_depth,
             compare_values=compare_values,
             compare_attributes=compare_attributes,
+            byte_identical_ok=byte_identical_ok,
         )
 
     def export(self, path_or_store: Any | Path | str) -> None:
         """
         Export the RKNS object to a new store, creating a deep copy of all data.
-        NOTE: This is a temporary solution, as in the future zarr.copy_all should be available.
+        The stored (compressed) chunks are copied as they are, without re-encoding.
 
         Parameters
         ----------
@@ -347,7 +584,7 @@ class RKNS:
         signal_array = self.handler.raw[RKNSNodeNames.raw_signal.value]
         # Write the array to the file in binary mode
         with open(file_path, "wb") as file:
-            file.write(signal_array[:].tobytes())  # type: ignore
+            write_raw_signal(signal_array, file)  # type: ignore
 
     def populate_rkns_from_raw(
         self, overwrite_if_exists: bool = False, validate: bool = True
@@ -356,6 +593,7 @@ class RKNS:
             overwrite_if_exists=overwrite_if_exists,
             validate=validate,
         )
+        self._clear_caches()
         return self
 
     def reset_rkns(self) -> Self:
@@ -366,6 +604,7 @@ class RKNS:
 
     def __exit__(self, *args):
         self.handler.close()
+        self._is_closed = True
 
     @property
     def tree(self, max_depth: int | None = None, show_attrs: bool = True) -> TreeRepr:
@@ -389,6 +628,7 @@ class RKNS:
 
 class RKNSBuilder:
     def __init__(self, store: Any | None = None):
+        self._store = store
         self._handler = StoreHandler(store)
 
     def _init_base_structure(self) -> None:
@@ -396,12 +636,12 @@ class RKNSBuilder:
         Initialize root node with all base attributes (no separate helpers).
         """
         # root node with header + timestamp
-        root = self._handler.create_group(path=None)
-        root.attrs.update(
-            {
+        root = self._handler.create_group(
+            path=None,
+            attributes={
                 "rkns_header": self._make_rkns_header(),
                 "creation_time": datetime.datetime.now().isoformat(),
-            }
+            },
         )
 
         # hierarchy of top-level groups
@@ -500,17 +740,18 @@ class RKNSBuilder:
         """
         handler = StoreHandler(store)
 
-        # compare header versions
+        # compare header versions, reading the root attributes only once
+        root_attrs = handler.root.attrs.asdict()
         try:
-            rkns_header = cast(dict[str, str], handler.root.attrs["rkns_header"])
+            rkns_header = cast(dict[str, str], root_attrs["rkns_header"])
         except KeyError as e:
             raise RKNSParseError("No rkns_header found in store.") from e
 
         current_header = self._make_rkns_header()
         if rkns_header.get("rkns_version") != current_header["rkns_version"]:
             raise ValueError(
-                f"RKNS version mismatch. Expected {current_header['version']}, "
-                f"but found {rkns_header.get('version')}."
+                f"RKNS version mismatch. Expected {current_header['rkns_version']}, "
+                f"but found {rkns_header.get('rkns_version')}."
             )
 
         # Courtesy warning if another implementation was used for creating the file
@@ -554,13 +795,30 @@ class RKNSBuilder:
             _description_
             _description_
         target_store
-            By default None. If None, a new Memory Store will be instantiated.
+            By default None. If None, a new Memory Store will be instantiated, or,
+            for files of at least MEMORY_STORE_MAX_FILE_SIZE_BYTES, a directory store
+            in a new temporary directory. The directory is removed when the RKNS
+            object is closed (e.g. on leaving its `with` block) or garbage collected.
+            Export the object to keep the data.
 
         Returns
         -------
             _description_
         """
         file_path = Path(file_path)
+        if (
+            self._store is None
+            and file_path.stat().st_size >= MEMORY_STORE_MAX_FILE_SIZE_BYTES
+        ):
+            # a memory store would keep all compressed chunks of the file in RAM.
+            # The directory is owned by the handler, i.e. removed when it is closed.
+            temporary_directory = tempfile.TemporaryDirectory(prefix="rkns-")
+            store_path = Path(temporary_directory.name) / "rkns.zarr"
+            self._store = get_or_create_target_store(store_path)
+            self._handler = StoreHandler(
+                self._store, temporary_directory=temporary_directory
+            )
+            logger.info(f"Storing {file_path.name} in temporary store {store_path}.")
         self._init_base_structure()
         Adapter = AdapterRegistry.get_adapter(file_format)
         adapter = Adapter(handler=self._handler)
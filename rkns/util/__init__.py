@@ -9,6 +9,7 @@ from .rkns_util import (
     check_rkns_validity,
     check_validity,
     get_freq_group,
+    write_raw_signal,
 )
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     "apply_check_open_to_all_methods",
     "check_validity",
     "get_freq_group",
+    "write_raw_signal",
 ]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+from functools import wraps
 from importlib import import_module
 from typing import TYPE_CHECKING, Any, Callable
 
@@ -83,8 +84,9 @@ def check_open(method: Callable):
         _description_
     """
 
+    @wraps(method)
     def wrapper(self, *args, **kwargs):
-        if hasattr(self, "_is_closed") and self._is_closed:
+        if getattr(self, "_is_closed", False):
             raise RuntimeError(
                 f"Cannot execute {method.__name__}: RKNS object has been closed"
             )
@@ -97,11 +99,15 @@ def apply_check_open_to_all_methods(cls: T) -> T:
     """
     Apply the @check_open decorator to all methods of a class.
     That is, it checks if the instance is closed before executing a method.
+    Methods named in the class attribute `_skip_check_open` are not wrapped, e.g.
+    private helpers on a hot path that are only reached through checked methods.
     """
+    skip_check_open = getattr(cls, "_skip_check_open", frozenset())
     for name, method in cls.__dict__.items():
         if (
             callable(method)
             and not name.startswith("__")
+            and name not in skip_check_open
             and not isinstance(method, (staticmethod, classmethod))
         ):
             # Skip staticmethods and classmethods
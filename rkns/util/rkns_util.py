@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
-from typing import Any, cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, BinaryIO, cast
 
 import numpy as np
 
-from rkns._zarr import ZarrGroup
+if TYPE_CHECKING:
+    from rkns._zarr import ZarrArray, ZarrGroup
 
 
 class RKNSNodeNames(str, Enum):
@@ -21,6 +24,10 @@ class RKNSNodeNames(str, Enum):
     popis = "popis"
     raw_signal = "signal"
     rkns_signal = "signal"
+    rkns_signal_physical_minmax = "physical_minmax"
+    rkns_signal_digital_minmax = "digital_minmax"
+    # (4, n_channels) array of the layout before the split into physical_minmax and
+    # digital_minmax, still written alongside them for readers of that layout.
     rkns_signal_minmaxs = "signal_minmaxs"
 
 
@@ -59,6 +66,8 @@ def check_rkns_validity(rkns_node: ZarrGroup | Any) -> None:
     - check array shapes
 
     """
+    from rkns._zarr import ZarrGroup
+
     if not isinstance(rkns_node, ZarrGroup):
         raise TypeError(f"The root node must be a Group, but is {type(rkns_node)}.")
 
@@ -83,7 +92,8 @@ def check_rkns_validity(rkns_node: ZarrGroup | Any) -> None:
             )
 
     # check that all child groups of the /rkns/signals group start with "fg_"
-    # If they do, check that they fg_ groups contain the "signal" and "signal_minmax" arrays.
+    # If they do, check that they fg_ groups contain the "signal", "physical_minmax"
+    # and "digital_minmax" arrays (or the legacy "signal_minmaxs" array).
     rkns_signals_group = cast(
         ZarrGroup, rkns_node[RKNSNodeNames.rkns_signals_group.value]
     )
@@ -98,10 +108,17 @@ def check_rkns_validity(rkns_node: ZarrGroup | Any) -> None:
                     f"Frequency group '{subgroup.basename}' is missing required '{RKNSNodeNames.rkns_signal.value}' array"
                 )
 
-            if RKNSNodeNames.rkns_signal_minmaxs.value not in subgroup:
-                raise ValueError(
-                    f"Frequency group '{subgroup.basename}' is missing required '{RKNSNodeNames.rkns_signal_minmaxs.value}' array"
-                )
+            if RKNSNodeNames.rkns_signal_minmaxs.value in subgroup:
+                continue
+
+            for minmax_node in (
+                RKNSNodeNames.rkns_signal_physical_minmax.value,
+                RKNSNodeNames.rkns_signal_digital_minmax.value,
+            ):
+                if minmax_node not in subgroup:
+                    raise ValueError(
+                        f"Frequency group '{subgroup.basename}' is missing required '{minmax_node}' array"
+                    )
 
 
 def check_raw_validity(_raw_node: ZarrGroup | Any) -> None:
@@ -109,6 +126,8 @@ def check_raw_validity(_raw_node: ZarrGroup | Any) -> None:
     TODO:
     - Check attribute types
     """
+    from rkns._zarr import ZarrGroup
+
     if not isinstance(_raw_node, ZarrGroup):
         raise TypeError(f"The root node must be a Group, but is {type(_raw_node)}.")
 
@@ -134,6 +153,39 @@ def check_raw_validity(_raw_node: ZarrGroup | Any) -> None:
         )
 
 
+# typed, as e.g. 256 and 256.0 are equal keys, but are formatted differently.
+@lru_cache(maxsize=256, typed=True)
 def get_freq_group(freq_in_Hz: float) -> str:
     prefix = RKNSNodeNames.frequency_group_prefix.value
     return f"{prefix}{np.round(freq_in_Hz, 1)}"
+
+
+def write_raw_signal(raw_signal_node: ZarrArray, file: BinaryIO) -> None:
+    """
+    Write the bytes of the raw signal into a binary file.
+
+    The bytes are streamed chunk by chunk. The next chunk is read (and decompressed)
+    in a background thread while the current one is written, such that at most two
+    decompressed chunks are held in memory at any time.
+
+    Parameters
+    ----------
+    raw_signal_node
+        The array /_raw/signal.
+    file
+        File opened in binary write mode.
+    """
+    chunk_size = raw_signal_node.chunks[0]
+    starts = range(0, raw_signal_node.shape[0], chunk_size)
+
+    def read_chunk(start: int) -> np.ndarray:
+        return raw_signal_node[start : start + chunk_size]  # type: ignore
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_chunk = executor.submit(read_chunk, starts[0]) if starts else None
+        for i in range(len(starts)):
+            chunk = cast(Future, next_chunk).result()
+            if i + 1 < len(starts):
+                next_chunk = executor.submit(read_chunk, starts[i + 1])
+            file.write(memoryview(chunk).cast("B"))
+    file.flush()
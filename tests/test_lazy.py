@@ -34,6 +34,13 @@ class TestLazySignal:
         assert pytest.approx(test_signal._m) == 2 / 3000
         assert pytest.approx(test_signal._bias) == -1500
 
+    def test_offset_rounding(self):
+        """The offset is rounded to float32 once, from the float64 parameters"""
+        _m = np.array([[0.1, 1 / 3, 2 / 4095]])
+        _bias = np.array([[-2047.5, 12345.678, 0.1]])
+        signal = LazySignal(np.zeros((1, 3), dtype=np.int16), _m, _bias)
+        np.testing.assert_array_equal(signal._c, (_m * _bias).astype(np.float32))
+
     def test_value_transform(self, test_signal):
         """Test physical value conversion"""
         # Known test case:
@@ -45,8 +52,8 @@ class TestLazySignal:
         """Test NumPy compatibility"""
         arr = np.array(test_signal)
         assert arr.shape == (3, 1)
-        assert arr.dtype == np.float64
-        assert pytest.approx(arr[0]) == -0.333333  # Midpoint should be zero
+        assert arr.dtype == np.float32
+        assert pytest.approx(arr[0]) == -0.3333333  # Midpoint should be zero
 
     def test_slicing(self, test_signal):
         """Test partial materialization"""
@@ -73,3 +80,68 @@ class TestLazySignal:
 
         ref = signal._m * (digital + signal._bias)
         np.testing.assert_allclose(signal[:10, :2], ref[:10, :2])
+
+    def test_param_cache(self):
+        """Sliced parameters are cached per index, without affecting the result"""
+        digital = zarr.array(np.arange(250).reshape(10, 25), dtype="int16")
+        signal = LazySignal.from_minmaxs(
+            digital,
+            pmin=-np.ones((1, 25)),
+            pmax=np.arange(1, 26).reshape(1, 25),
+            dmin=np.zeros((1, 25)),
+            dmax=3000 * np.ones((1, 25)),
+        )
+        ref = signal._m * (digital[:] + signal._bias)
+
+        for idx in [
+            (slice(2, 5), slice(1, 3)),
+            (slice(2, 5), slice(1, 4)),
+            (slice(None), np.array([3, 1])),
+            (slice(None), np.array([1, 3])),
+            (slice(None), [0, 2]),
+            (4, 7),
+        ]:
+            first = signal.slice_columns_param(idx)
+            assert signal.slice_columns_param(idx) is first
+            np.testing.assert_allclose(signal[idx], ref[idx], rtol=1e-6)
+
+        assert len(signal._param_cache) == 6
+
+    def test_full_index(self, test_signal):
+        """Reading the whole signal gives the same result for all full indices"""
+        ref = test_signal._transform(test_signal._source[:], slice(1, None))
+        for idx in [slice(None), ..., (slice(None), slice(None)), (..., slice(None))]:
+            assert LazySignal.is_full_index(idx)
+            np.testing.assert_array_equal(test_signal[idx], ref)
+
+        for idx in [slice(1, None), (slice(None), 0), (..., ...), 0]:
+            assert not LazySignal.is_full_index(idx)
+
+    def test_read_into(self, test_signal):
+        """Reading into a buffer matches indexing"""
+        out = np.empty((2, 1), dtype=test_signal.dtype)
+        for start in range(0, test_signal.shape[0] - 1):
+            idx = (slice(start, start + 2), slice(0, 1))
+            assert test_signal.read_into(idx, out) is out
+            np.testing.assert_array_equal(out, test_signal[idx])
+
+        out = np.empty(test_signal.shape, dtype=test_signal.dtype)
+        np.testing.assert_array_equal(test_signal.read_into(..., out), test_signal[:])
+
+        with pytest.raises(ValueError):
+            test_signal.read_into(slice(0, 1), out)
+
+    def test_identity(self):
+        """Identity scaling only casts the data to the output dtype"""
+        data = np.arange(12, dtype=np.int16).reshape(4, 3)
+        signal = LazySignal(data, np.ones((1, 3)), np.zeros((1, 3)))
+        assert signal._identity
+
+        for idx in [slice(None), (slice(1, 3), 1), 2]:
+            result = signal[idx]
+            assert result.dtype == np.float32
+            np.testing.assert_array_equal(result, data[idx])
+
+        signal = LazySignal(data, np.ones((1, 3)), np.array([[0, 1, 0]]))
+        assert not signal._identity
+        np.testing.assert_array_equal(signal[:, 1], data[:, 1] + 1)
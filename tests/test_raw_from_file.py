@@ -4,6 +4,12 @@ from pathlib import Path
 
 import pytest
 
+from rkns.adapters import edf_adapter
+from rkns.adapters.edf_adapter import raw_signal_as_file
+from rkns.detectors import FileFormatRegistry
+from rkns.detectors.edf_detector import EDF_HEADER_SIZE_BYTES
+from rkns.detectors.registry import PREFIX_SIZE_BYTES
+from rkns.file_formats import FileFormat
 from rkns.rkns import RKNS
 from rkns.util import RKNSNodeNames
 
@@ -16,8 +22,13 @@ def get_file_md5(path: str | Path) -> str:
     return ref_md5
 
 
+@pytest.mark.parametrize("raw_chunk_size", [None, 1000])
 @pytest.mark.parametrize("path", paths)
-def test_raw_md5(path):
+def test_raw_md5(path, raw_chunk_size, monkeypatch):
+    if raw_chunk_size is not None:
+        # hash and write the file in many blocks
+        monkeypatch.setattr(edf_adapter, "RAW_CHUNK_SIZE_BYTES", raw_chunk_size)
+
     rkns_obj = RKNS.from_file(path, populate_from_raw=False)
     _raw_signal = rkns_obj.handler.raw[RKNSNodeNames.raw_signal.value]
     md5 = _raw_signal.attrs["md5"]  # type: ignore
@@ -30,6 +41,18 @@ def test_raw_md5(path):
     assert md5 == ref_md5 == reconstructed_md5
 
 
+@pytest.mark.parametrize("use_memfd", [True, False])
+@pytest.mark.parametrize("path", paths)
+def test_raw_signal_as_file(path, use_memfd, monkeypatch):
+    if not use_memfd:
+        monkeypatch.delattr("os.memfd_create", raising=False)
+
+    rkns_obj = RKNS.from_file(path, populate_from_raw=False)
+    _raw_signal = rkns_obj.handler.raw[RKNSNodeNames.raw_signal.value]
+    with raw_signal_as_file(_raw_signal) as raw_path:
+        assert get_file_md5(raw_path) == get_file_md5(path)
+
+
 # TODO: This will fail, but is a non-trivial problem of how zarr works.
 # @pytest.mark.parametrize("path", paths)
 # def test_raw_readonly(path):
@@ -40,3 +63,49 @@ def test_raw_md5(path):
 
 if __name__ == "main":
     pytest.main()
+
+
+@pytest.mark.parametrize("path", paths)
+def test_detect_fileformat(path, tmp_path):
+    """
+    EDFs are detected from the file prefix, which is read once by the registry.
+    """
+    assert FileFormatRegistry.detect_fileformat(path) == FileFormat.EDF
+
+    # files shorter than the fixed-size EDF header are not detected as EDF
+    truncated_path = tmp_path / "truncated.edf"
+    truncated_path.write_bytes(Path(path).read_bytes()[:100])
+    assert FileFormatRegistry.detect_fileformat(truncated_path) == FileFormat.UNKNOWN
+
+    # an already-read prefix takes precedence over the file content
+    edf_detector = FileFormatRegistry.get_detector(FileFormat.EDF)
+    prefix = b"1".ljust(256)
+    assert edf_detector(truncated_path, prefix) == FileFormat.EDF_PLUS
+
+
+def detect_bdf_by_suffix(path):
+    """Detector without the prefix argument."""
+    return FileFormat.BDF if Path(path).suffix == ".bdf" else FileFormat.UNKNOWN
+
+
+def test_detect_fileformat_without_prefix(tmp_path, monkeypatch):
+    """
+    Detectors that only take the path are called without the file prefix.
+    """
+    for attr in ("_detector_fn_path", "_resolved", "_resolved_accepts_prefix"):
+        monkeypatch.setattr(
+            FileFormatRegistry, attr, getattr(FileFormatRegistry, attr).copy()
+        )
+    FileFormatRegistry.register_detector(
+        FileFormat.BDF, "tests.test_raw_from_file.detect_bdf_by_suffix"
+    )
+    bdf_path = tmp_path / "file.bdf"
+    bdf_path.write_bytes(b"\xff" * 300)
+    assert FileFormatRegistry.detect_fileformat(bdf_path) == FileFormat.BDF
+    assert (
+        FileFormatRegistry.detect_fileformat(tmp_path / "x.txt") == FileFormat.UNKNOWN
+    )
+
+
+def test_prefix_covers_edf_header():
+    assert PREFIX_SIZE_BYTES >= EDF_HEADER_SIZE_BYTES
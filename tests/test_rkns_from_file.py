@@ -1,3 +1,4 @@
+import gc
 import hashlib
 import tempfile
 from collections import defaultdict
@@ -6,12 +7,18 @@ from pathlib import Path
 import numpy as np
 import pyedflib
 import pytest
+import zarr
 
+from rkns.adapters.edf_adapter import RKNSEdfAdapter, _zstd_level_from_env
 from rkns.rkns import RKNS
-from rkns.util import check_validity
+from rkns.util import RKNSNodeNames, check_validity
 from rkns.util.rkns_util import check_raw_validity, check_rkns_validity, get_freq_group
 
 paths = ["tests/files/test_file.edf"]
+# physical signals are computed in float32, i.e. they are exact up to float32
+# rounding relative to the physical range (below 256 in the test files).
+FLOAT32_EPS = float(np.finfo(np.float32).eps)
+FLOAT32_TOL = dict(rtol=2 * FLOAT32_EPS, atol=256 * FLOAT32_EPS)
 # paths = ["data_shhs1/shhs1-200001.edf"]
 
 
@@ -62,6 +69,40 @@ def test_validity(path, rkns_obj):
 
 
 ########### Getter Functions #########
+@pytest.mark.parametrize("path", paths)
+def test_attribute_cache(path, rkns_obj):
+    """
+    Attributes and signals are read once from the store and dropped when /rkns is populated.
+    """
+    assert rkns_obj.admin_info == rkns_obj.handler.rkns.attrs["admin_info"]
+    fg = rkns_obj._get_frequencygroups()[0]
+    assert (
+        rkns_obj._get_channel_names_by_fg(fg)
+        == (rkns_obj.handler.signals[fg].attrs["channels"])
+    )
+    assert rkns_obj._rkns_attrs is not None
+    assert fg in rkns_obj._fg_attrs
+    assert rkns_obj._get_signal_by_fg(fg) is rkns_obj._get_signal_by_fg(fg)
+    assert rkns_obj._get_fg_node(fg) is rkns_obj._get_fg_node(fg)
+    assert rkns_obj.handler.signals is rkns_obj.handler.signals
+
+    # stale attributes and signals are dropped when populating /rkns
+    rkns_obj = RKNS.from_file(path, populate_from_raw=False)
+    rkns_obj._rkns_attrs = {}
+    rkns_obj.populate_rkns_from_raw()
+    assert rkns_obj.admin_info == rkns_obj.handler.rkns.attrs["admin_info"]
+    assert fg in rkns_obj.handler.signals
+
+
+def test_skip_check_open():
+    """
+    The helpers exempt from the closed check exist and are not wrapped.
+    """
+    for name in RKNS._skip_check_open:
+        assert not hasattr(RKNS.__dict__[name], "__wrapped__")
+    assert hasattr(RKNS.__dict__["get_signal"], "__wrapped__")
+
+
 @pytest.mark.parametrize("path", paths)
 def test_frequency_groups(path, rkns_obj, pyedf_digital):
     fg_names = rkns_obj._get_frequencygroups()
@@ -97,6 +138,18 @@ def test_channel_names(path, rkns_obj, pyedf_digital):
     assert set(channel_names) == reference_channel_names
 
 
+@pytest.mark.parametrize("path", paths)
+def test_channel_order(path, rkns_obj):
+    fg = rkns_obj._get_frequencygroups()[0]
+    channel_order = rkns_obj.get_channel_order(frequency_group=fg)
+    assert list(channel_order) == rkns_obj._get_channel_names_by_fg(fg)
+    assert list(channel_order.values()) == list(range(len(channel_order)))
+
+    # the mapping is shared between calls, so it must not be modifiable
+    with pytest.raises(TypeError):
+        channel_order["new_channel"] = 0  # type: ignore
+
+
 @pytest.mark.parametrize("path", paths)
 def test_frequency_by_channel(path, rkns_obj, pyedf_digital):
     channel_data_dig, signal_headers, header = pyedf_digital
@@ -142,6 +195,11 @@ def test_rkns_from_edf_minmax(path, rkns_obj, pyedf_digital):
     for fg in fgs:
         channel_names = rkns_obj._get_channel_names_by_fg(fg)
         rkns_pminmax_dminmax = rkns_obj._pminmax_dminmax_by_fg(fg)
+        fg_node = rkns_obj.handler.signals[fg]
+        assert (
+            fg_node[RKNSNodeNames.rkns_signal_physical_minmax.value].dtype == np.float32
+        )
+        assert fg_node[RKNSNodeNames.rkns_signal_digital_minmax.value].dtype == np.int16
         for i, channel_name in enumerate(channel_names):
             val1 = reference_fgs[channel_name]
             val2 = rkns_pminmax_dminmax[:].T[i]
@@ -168,6 +226,146 @@ def test_rkns_from_edf_digital(path, rkns_obj, pyedf_digital):
             np.testing.assert_allclose(val1, val2)
 
 
+@pytest.mark.parametrize("path", paths)
+def test_rkns_from_edf_small_raw_chunks(path, pyedf_digital, monkeypatch):
+    """
+    The raw signal is streamed chunk-wise to pyedflib, which should not affect the result.
+    """
+    monkeypatch.setattr("rkns.adapters.edf_adapter.RAW_CHUNK_SIZE_BYTES", 1000)
+    rkns_obj = RKNS.from_file(path, populate_from_raw=True)
+    raw_signal = rkns_obj.handler.raw[RKNSNodeNames.raw_signal.value]
+    assert raw_signal.chunks == (1000,)
+
+    channel_data_dig, signal_headers, header = pyedf_digital
+    for s, data in zip(signal_headers, channel_data_dig):
+        fg = get_freq_group(s["sample_frequency"])
+        i = rkns_obj.get_channel_order(frequency_group=fg)[s["label"]]
+        np.testing.assert_array_equal(
+            data, rkns_obj._get_digital_signal_by_fg(fg)[:, i]
+        )
+
+
+@pytest.mark.parametrize("path", paths)
+def test_rkns_from_edf_directory_store(path, monkeypatch, tmp_path):
+    """
+    Large files are ingested into a temporary directory instead of a memory store,
+    which is removed together with the RKNS object.
+    """
+    monkeypatch.setattr("rkns.rkns.MEMORY_STORE_MAX_FILE_SIZE_BYTES", 0)
+    monkeypatch.setattr("tempfile.tempdir", str(tmp_path))
+    with RKNS.from_file(path, populate_from_raw=True) as rkns_obj:
+        (store_dir,) = tmp_path.iterdir()
+        assert any((store_dir / "rkns.zarr").iterdir())
+        check_validity(rkns_obj.handler.root)
+    # the temporary directory is removed when closing the RKNS object
+    assert not store_dir.exists()
+
+    rkns_obj = RKNS.from_file(path, populate_from_raw=True)
+    (store_dir,) = tmp_path.iterdir()
+    del rkns_obj
+    gc.collect()
+    assert not store_dir.exists()
+
+
+@pytest.mark.parametrize("path", paths)
+def test_rkns_from_edf_small_signal_chunks(path, pyedf_digital, monkeypatch):
+    """
+    The signals are chunked along the samples, which should not affect the result.
+    """
+    monkeypatch.setattr("rkns.adapters.edf_adapter.SIGNAL_CHUNK_SIZE_BYTES", 1000)
+    rkns_obj = RKNS.from_file(path, populate_from_raw=True)
+
+    channel_data_dig, signal_headers, header = pyedf_digital
+    for fg in rkns_obj._get_frequencygroups():
+        digital_signal = rkns_obj._get_digital_signal_by_fg(fg)
+        n_samples, n_channels = digital_signal.shape
+        chunk_samples = min(n_samples, 1000 // (2 * n_channels))
+        assert digital_signal.chunks == (chunk_samples, n_channels)
+
+    for s, data in zip(signal_headers, channel_data_dig):
+        fg = get_freq_group(s["sample_frequency"])
+        i = rkns_obj.get_channel_order(frequency_group=fg)[s["label"]]
+        np.testing.assert_array_equal(
+            data, rkns_obj._get_digital_signal_by_fg(fg)[:, i]
+        )
+
+
+@pytest.mark.parametrize("path", paths)
+def test_rkns_from_edf_compression_level(path, pyedf_digital, monkeypatch):
+    """
+    The Zstd compression levels are configurable and do not affect the signal.
+    """
+    monkeypatch.setattr(RKNSEdfAdapter, "zstd_level", RKNSEdfAdapter.zstd_level)
+    monkeypatch.setattr(RKNSEdfAdapter, "raw_zstd_level", RKNSEdfAdapter.raw_zstd_level)
+    RKNSEdfAdapter.set_compression(19, raw_level=5)
+    assert RKNSEdfAdapter.zstd_level == 19
+    assert RKNSEdfAdapter.raw_zstd_level == 5
+    with pytest.raises(ValueError):
+        RKNSEdfAdapter.set_compression(23)
+    with pytest.raises(ValueError):
+        RKNSEdfAdapter.set_compression(19, raw_level=23)
+
+    rkns_obj = RKNS.from_file(path, populate_from_raw=True)
+    raw_signal = rkns_obj.handler.raw[RKNSNodeNames.raw_signal.value]
+    # zarr v3 arrays have a tuple of compressors, zarr v2 arrays a single compressor
+    compressors = getattr(raw_signal, "compressors", None)
+    compressor = compressors[0] if compressors else raw_signal.compressor
+    assert compressor.level == 5
+
+    signal = rkns_obj._get_digital_signal_by_fg(rkns_obj._get_frequencygroups()[0])
+    compressors = getattr(signal, "compressors", None)
+    compressor = compressors[0] if compressors else signal.compressor
+    assert compressor.level == 19
+
+    channel_data_dig, signal_headers, header = pyedf_digital
+    for s, data in zip(signal_headers, channel_data_dig):
+        fg = get_freq_group(s["sample_frequency"])
+        i = rkns_obj.get_channel_order(frequency_group=fg)[s["label"]]
+        np.testing.assert_array_equal(
+            data, rkns_obj._get_digital_signal_by_fg(fg)[:, i]
+        )
+
+
+def test_zstd_level_from_env(monkeypatch):
+    """
+    Compression levels from the environment are validated, invalid ones are ignored.
+    """
+    monkeypatch.delenv("RKNS_TEST_ZSTD_LEVEL", raising=False)
+    assert _zstd_level_from_env("RKNS_TEST_ZSTD_LEVEL", 10) == 10
+    monkeypatch.setenv("RKNS_TEST_ZSTD_LEVEL", "19")
+    assert _zstd_level_from_env("RKNS_TEST_ZSTD_LEVEL", 10) == 19
+
+    for value in ("high", "23"):
+        monkeypatch.setenv("RKNS_TEST_ZSTD_LEVEL", value)
+        with pytest.warns(UserWarning, match="RKNS_TEST_ZSTD_LEVEL"):
+            assert _zstd_level_from_env("RKNS_TEST_ZSTD_LEVEL", 10) == 10
+
+
+def test_rkns_from_edf_single_frequency_group(tmp_path):
+    """
+    EDF files with a uniform sample rate result in a single frequency group.
+    """
+    rng = np.random.default_rng(42)
+    n_channels, sfreq, duration = 5, 128.0, 10
+    signals = rng.uniform(-100, 100, size=(n_channels, int(sfreq * duration)))
+    signal_headers = pyedflib.highlevel.make_signal_headers(
+        [f"ch{i}" for i in range(n_channels)],
+        sample_frequency=sfreq,
+        physical_min=-100,
+        physical_max=100,
+    )
+    path = str(tmp_path / "single_fg.edf")
+    pyedflib.highlevel.write_edf(path, signals, signal_headers)
+    channel_data_dig, _, _ = pyedflib.highlevel.read_edf(path, digital=True)
+
+    rkns_obj = RKNS.from_file(path, populate_from_raw=True)
+    assert rkns_obj._get_frequencygroups() == [get_freq_group(sfreq)]
+
+    digital_signal = rkns_obj._get_digital_signal_by_fg(get_freq_group(sfreq))
+    assert digital_signal.shape == (int(sfreq * duration), n_channels)
+    np.testing.assert_array_equal(np.asarray(channel_data_dig).T, digital_signal[:])
+
+
 @pytest.mark.parametrize("path", paths)
 def test_rkns_from_edf_physical(path, rkns_obj, pyedf_physical):
     channel_data_dig, signal_headers, header = pyedf_physical
@@ -189,10 +387,17 @@ def test_rkns_from_edf_physical(path, rkns_obj, pyedf_physical):
             val2 = rkns_physical_signal[:].T[i]
             val3 = rkns_physical_signal_direct[:].T[i]
 
-            np.testing.assert_allclose(val1, val2)
+            np.testing.assert_allclose(val1, val2, **FLOAT32_TOL)
             np.testing.assert_allclose(val2, val3)
 
 
+def test_validate_consistent_duration():
+    signal_headers = [{"sample_frequency": 100.0}, {"sample_frequency": 50.0}]
+    RKNSEdfAdapter.validate_consistent_duration([1000, 500], signal_headers)
+    with pytest.raises(ValueError):
+        RKNSEdfAdapter.validate_consistent_duration([1000, 1000], signal_headers)
+
+
 @pytest.mark.parametrize("path", paths)
 def test_get_signal_by_singlechannel(path, rkns_obj, pyedf_physical):
     """
@@ -211,7 +416,9 @@ def test_get_signal_by_singlechannel(path, rkns_obj, pyedf_physical):
     for channel_name in reference.keys():
         signal = rkns_obj.get_signal(channel_name)
         assert signal.shape == reference[channel_name]["data"].shape
-        np.testing.assert_allclose(reference[channel_name]["data"], signal)
+        np.testing.assert_allclose(
+            reference[channel_name]["data"], signal, **FLOAT32_TOL
+        )
         assert isinstance(signal, np.ndarray)
 
     # test with channel not existing
@@ -246,14 +453,21 @@ def test_get_signal_by_multichannel_singlegroup(path, rkns_obj, pyedf_physical):
     ref = np.concatenate([reference[c]["data"] for c in channels], 1)
     rkns_signal = rkns_obj.get_signal(channels)
     assert ref.shape == rkns_signal.shape
-    np.testing.assert_allclose(ref, rkns_signal)
+    np.testing.assert_allclose(ref, rkns_signal, **FLOAT32_TOL)
 
     # test with subset of channels of the group
     channels = fg_to_channel[fgs[1]][::-2]
     ref = np.concatenate([reference[c]["data"] for c in channels], 1)
     rkns_signal = rkns_obj.get_signal(channels)
     assert ref.shape == rkns_signal.shape
-    np.testing.assert_allclose(ref, rkns_signal)
+    np.testing.assert_allclose(ref, rkns_signal, **FLOAT32_TOL)
+
+    # test with consecutive channels of the group, which are selected by a slice
+    channels = fg_to_channel[fgs[1]][1:3]
+    ref = np.concatenate([reference[c]["data"] for c in channels], 1)
+    rkns_signal = rkns_obj.get_signal(channels)
+    assert ref.shape == rkns_signal.shape
+    np.testing.assert_allclose(ref, rkns_signal, **FLOAT32_TOL)
 
     # test with one channel not existing
     channels = fg_to_channel[fgs[1]][:2]
@@ -265,6 +479,27 @@ def test_get_signal_by_multichannel_singlegroup(path, rkns_obj, pyedf_physical):
         rkns_obj.get_signal(["DC01", "DC04"])
 
 
+@pytest.mark.parametrize("path", paths)
+def test_frequency_group_names(path, pyedf_digital):
+    """
+    The frequency groups written on ingestion are the ones looked up by frequency,
+    also if the group names of equal integer frequencies were requested before.
+    """
+    channel_data_dig, signal_headers, header = pyedf_digital
+    sfreqs = {s["sample_frequency"] for s in signal_headers}
+    get_freq_group.cache_clear()
+    for sfreq in sfreqs:
+        get_freq_group(np.int64(sfreq))
+
+    rkns_obj = RKNS.from_file(path, populate_from_raw=True)
+    assert set(rkns_obj._get_frequencygroups()) == {
+        get_freq_group.__wrapped__(sfreq) for sfreq in sfreqs
+    }
+    for s, data in zip(signal_headers, channel_data_dig):
+        signal = rkns_obj.get_signal(sfreq_Hz=float(s["sample_frequency"]))
+        assert signal.shape[0] == len(data)
+
+
 @pytest.mark.parametrize("path", paths)
 def test_get_signal_by_frequency(path, rkns_obj, pyedf_physical):
     """
@@ -294,7 +529,7 @@ def test_get_signal_by_frequency(path, rkns_obj, pyedf_physical):
             signal_ref_ch = reference[channel_name]["data"]
             signal_rkns_ch = signal_sfreq[:].T[i]
 
-            np.testing.assert_allclose(signal_ref_ch, signal_rkns_ch)
+            np.testing.assert_allclose(signal_ref_ch, signal_rkns_ch, **FLOAT32_TOL)
             # np.testing.assert_allclose(val2, val3)
 
     # test with frequency not existing
@@ -331,7 +566,7 @@ def test_get_signal_by_time(path, rkns_obj, pyedf_physical):
         channels,
         time_range=(0, rkns_obj.get_recording_duration() / 2),
     )
-    np.testing.assert_allclose(ref[: ref.shape[0] // 2, :], rkns_signal)
+    np.testing.assert_allclose(ref[: ref.shape[0] // 2, :], rkns_signal, **FLOAT32_TOL)
 
     ref = np.concatenate([reference[c]["data"] for c in channels], 1)
 
@@ -343,13 +578,91 @@ def test_get_signal_by_time(path, rkns_obj, pyedf_physical):
         ),
     )
     np.testing.assert_allclose(
-        ref[ref.shape[0] // 4 : ref.shape[0] * 3 // 4, :3], rkns_signal
+        ref[ref.shape[0] // 4 : ref.shape[0] * 3 // 4, :3], rkns_signal, **FLOAT32_TOL
+    )
+
+    # an end beyond the recording is clipped to the recording
+    rkns_signal = rkns_obj.get_signal(
+        channels[:3],
+        time_range=(
+            rkns_obj.get_recording_duration() / 4,
+            rkns_obj.get_recording_duration() * 2,
+        ),
     )
+    np.testing.assert_allclose(ref[ref.shape[0] // 4 :, :3], rkns_signal, **FLOAT32_TOL)
 
     with pytest.raises(ValueError):
         rkns_signal = rkns_obj.get_signal(channels[:3], time_range=(1, 0))
 
 
+@pytest.mark.parametrize("path", paths)
+def test_get_signal_snap_to_chunks(path, pyedf_physical, monkeypatch):
+    """
+    Snapping extends the time range to the chunk boundaries.
+    """
+    monkeypatch.setattr("rkns.adapters.edf_adapter.SIGNAL_CHUNK_SIZE_BYTES", 1000)
+    rkns_obj = RKNS.from_file(path, populate_from_raw=True)
+    channel_data, signal_headers, header = pyedf_physical
+    s, data = signal_headers[0], channel_data[0]
+    fg = get_freq_group(s["sample_frequency"])
+    n = rkns_obj.get_samples_per_chunk(fg)
+    assert 1 < n < len(data)
+
+    sfreq = s["sample_frequency"]
+    rkns_signal = rkns_obj.get_signal(
+        s["label"],
+        time_range=((n + 1.5) / sfreq, (2 * n + 1.5) / sfreq),
+        snap_to_chunks=True,
+    )
+    np.testing.assert_allclose(rkns_signal[:, 0], data[n : 3 * n], **FLOAT32_TOL)
+
+    # the whole recording is already aligned
+    rkns_signal = rkns_obj.get_signal(s["label"], snap_to_chunks=True)
+    np.testing.assert_allclose(rkns_signal[:, 0], data, **FLOAT32_TOL)
+
+
+@pytest.mark.parametrize("path", paths)
+def test_compile_getter(path):
+    """
+    A compiled getter returns the same data as the equivalent get_signal call,
+    also when reading into a preallocated buffer.
+    """
+    rkns_obj = RKNS.from_file(path, populate_from_raw=True)
+    for channel in rkns_obj.get_channel_names():
+        getter = rkns_obj.compile_getter(channel, time_range=(1, 3))
+        expected = rkns_obj.get_signal(channel, time_range=(1, 3))
+        np.testing.assert_array_equal(getter(), expected)
+        np.testing.assert_array_equal(getter(), expected)
+
+        out = np.empty_like(expected)
+        assert getter(out=out) is out
+        np.testing.assert_array_equal(out, expected)
+        assert rkns_obj.get_signal(channel, time_range=(1, 3), out=out) is out
+        np.testing.assert_array_equal(out, expected)
+
+        with pytest.raises(ValueError):
+            rkns_obj.get_signal(channel, time_range=(1, 2), out=out)
+
+    with pytest.raises(ValueError):
+        rkns_obj.compile_getter()
+
+
+@pytest.mark.parametrize("path", paths)
+def test_compile_getter_closed(path):
+    """
+    A compiled getter can no longer be called once its RKNS object has been closed.
+    """
+    with RKNS.from_file(path, populate_from_raw=True) as rkns_obj:
+        channel = rkns_obj.get_channel_names()[0]
+        getter = rkns_obj.compile_getter(channel, time_range=(1, 3))
+        getter()
+
+    with pytest.raises(RuntimeError, match="has been closed"):
+        getter()
+    with pytest.raises(RuntimeError, match="has been closed"):
+        rkns_obj.get_signal(channel, time_range=(1, 3))
+
+
 @pytest.mark.parametrize(
     "path, suffix",
     [(path, suffix) for path in paths for suffix in [".rkns"]],
@@ -367,6 +680,74 @@ def test_export_filesystem(path, suffix):
         rkns_obj1.export(Path(temp_file1))
         reloaded1 = RKNS.from_file(temp_file1)
         assert reloaded1.is_equal_to(rkns_obj1)
+        assert reloaded1.is_equal_to(rkns_obj1, byte_identical_ok=True)
+
+
+@pytest.mark.parametrize("path", paths)
+def test_is_equal_to_different_compression(path, monkeypatch):
+    """
+    Stores with equal values, but written at different compression levels are equal.
+    """
+    rkns_obj1 = RKNS.from_file(path, populate_from_raw=True)
+    monkeypatch.setattr(RKNSEdfAdapter, "zstd_level", 1)
+    monkeypatch.setattr(RKNSEdfAdapter, "raw_zstd_level", 1)
+    rkns_obj2 = RKNS.from_file(path, populate_from_raw=True)
+
+    for byte_identical_ok in (False, True):
+        assert rkns_obj1.is_equal_to(
+            rkns_obj2, compare_attributes=False, byte_identical_ok=byte_identical_ok
+        )
+
+
+@pytest.mark.parametrize("path", paths)
+def test_version_mismatch(path, tmp_path):
+    """
+    Stores written by another RKNS version are rejected with both versions named.
+    """
+    export_path = tmp_path / "file.rkns"
+    RKNS.from_file(path, populate_from_raw=False).export(export_path)
+    root = zarr.open_group(str(export_path), mode="a")
+    root.attrs["rkns_header"] = {
+        **root.attrs["rkns_header"],
+        "rkns_version": "0.0.0",
+    }
+
+    with pytest.raises(ValueError, match="but found 0.0.0"):
+        RKNS.from_file(str(export_path))
+
+
+@pytest.mark.parametrize("path", paths)
+def test_legacy_signal_minmaxs(path, tmp_path):
+    """
+    The (4, n_channels) signal_minmaxs array of the previous layout is written
+    alongside physical_minmax and digital_minmax, and suffices for reading.
+    """
+    export_path = tmp_path / "file.rkns"
+    rkns_obj = RKNS.from_file(path, populate_from_raw=True)
+    rkns_obj.export(export_path)
+
+    signals = zarr.open_group(str(export_path), mode="a")[
+        f"{RKNSNodeNames.rkns_root.value}/{RKNSNodeNames.rkns_signals_group.value}"
+    ]
+    for fg in rkns_obj._get_frequencygroups():
+        fg_node = signals[fg]
+        signal_minmaxs = fg_node[RKNSNodeNames.rkns_signal_minmaxs.value][:]
+        physical_minmax = fg_node[RKNSNodeNames.rkns_signal_physical_minmax.value][:]
+        digital_minmax = fg_node[RKNSNodeNames.rkns_signal_digital_minmax.value][:]
+        assert signal_minmaxs.dtype == np.float64
+        np.testing.assert_allclose(signal_minmaxs[:2], physical_minmax, rtol=1e-6)
+        np.testing.assert_array_equal(signal_minmaxs[2:], digital_minmax)
+
+        # stores of the previous layout only hold signal_minmaxs
+        del fg_node[RKNSNodeNames.rkns_signal_physical_minmax.value]
+        del fg_node[RKNSNodeNames.rkns_signal_digital_minmax.value]
+        assert RKNSNodeNames.rkns_signal_physical_minmax.value not in fg_node
+
+    legacy_obj = RKNS.from_file(str(export_path))
+    for channel in rkns_obj.get_channel_names():
+        np.testing.assert_array_equal(
+            legacy_obj.get_signal(channel), rkns_obj.get_signal(channel)
+        )
 
 
 @pytest.mark.parametrize(
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from rkns.util.misc import (
@@ -5,6 +6,7 @@ from rkns.util.misc import (
     check_open,
     import_from_string,
 )
+from rkns.util.rkns_util import get_freq_group
 
 
 def test_import_from_string():
@@ -26,6 +28,27 @@ def test_import_from_string():
         import_from_string("utils_tests.unexistent")
 
 
+@pytest.mark.parametrize(
+    "freqs",
+    [
+        (256, 256.0),
+        (256.0, 256),
+        (np.int64(256), np.float64(256)),
+        (np.float64(256), np.int64(256)),
+    ],
+)
+def test_get_freq_group_cache(freqs):
+    """
+    The cached group names match the uncached ones, independent of the call order,
+    although e.g. 256 and 256.0 are equal (cache) keys.
+    """
+    get_freq_group.cache_clear()
+    for freq in freqs:
+        assert get_freq_group(freq) == get_freq_group.__wrapped__(freq)
+    for freq in freqs:
+        assert get_freq_group(freq) == get_freq_group.__wrapped__(freq)
+
+
 # Mock class for testing
 @apply_check_open_to_all_methods
 class MockRKNS:
@@ -103,3 +126,23 @@ class TestCheckOpenDecorator:
         assert test_instance.static_method() == "Static method"
         assert test_instance.class_method() == "Class method"
         assert test_instance.instance_method() == "Instance method"
+
+    def test_apply_check_open_to_all_methods_skips_listed_methods(self):
+        @apply_check_open_to_all_methods
+        class TestClass:
+            _skip_check_open = frozenset({"_unchecked_method"})
+
+            def __init__(self):
+                self._is_closed = True
+
+            def _unchecked_method(self):
+                return "Unchecked method"
+
+            def _private_method(self):
+                return "Private method"
+
+        test_instance = TestClass()
+        assert test_instance._unchecked_method() == "Unchecked method"
+        with pytest.raises(RuntimeError) as exc_info:
+            test_instance._private_method()
+        assert "Cannot execute _private_method" in str(exc_info.value)
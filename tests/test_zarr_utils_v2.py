@@ -24,8 +24,11 @@ from rkns._zarr import (  # noqa: E402
     compare_attrs,
     copy_attributes,
     copy_group_recursive,
+    copy_store,
+    create_child_array,
     deep_compare_groups,
     get_or_create_target_store,
+    stores_equal,
 )
 from rkns.errors import (  # noqa: E402
     ArrayShapeMismatchError,
@@ -196,6 +199,39 @@ class TestCopyGroupRecursive:
         assert target_array.compressor.clevel == 3  # type: ignore
 
 
+class TestCopyStore:
+    def test_copy_store(self, temp_zarr_store, source_group):
+        """Test copying all keys of a store, including metadata and chunks."""
+        target_store = MemoryStore()
+        copy_store(temp_zarr_store.store, target_store)
+
+        target_root = zarr.open_group(store=target_store, mode="r")
+        assert deep_compare_groups(temp_zarr_store, target_root)
+        np.testing.assert_array_equal(
+            target_root["test_group/subgroup/subarray"][:], np.ones((2, 2))
+        )
+        assert target_root["test_group"].attrs["group_attr2"] == [1, 2, 3]
+
+
+class TestStoresEqual:
+    def test_stores_equal(self, temp_zarr_store, source_group):
+        """Test comparing the keys and raw values of two stores."""
+        target_store = MemoryStore()
+        copy_store(temp_zarr_store.store, target_store)
+        assert stores_equal(temp_zarr_store.store, target_store)
+
+        target_root = zarr.open_group(store=target_store)
+        target_root["test_group/array1"][0, 0] = 2.0
+        assert not stores_equal(temp_zarr_store.store, target_store)
+
+    def test_stores_equal_different_keys(self, temp_zarr_store, source_group):
+        """Test that stores with different members are not equal."""
+        target_store = MemoryStore()
+        copy_store(temp_zarr_store.store, target_store)
+        zarr.open_group(store=target_store).create_group("extra_group")
+        assert not stores_equal(temp_zarr_store.store, target_store)
+
+
 class TestGetTargetStore:
     def test_get_target_store_with_valid_path(self, tmp_path):
         path = tmp_path / "test_store"
@@ -255,6 +291,25 @@ def attributes():
     return {"key1": "value1", "key2": "value2"}
 
 
+class TestCreateChildArray:
+    def test_create_child_array(self, parent_node, data, name, attributes):
+        zarr_array = create_child_array(
+            parent_node, name, data.shape, data.dtype, attributes, chunks=(5, 10)
+        )
+
+        assert name in parent_node.array_keys()
+        assert zarr_array.shape == data.shape
+        assert zarr_array.dtype == data.dtype
+        assert zarr_array.chunks == (5, 10)
+        for key, value in attributes.items():
+            assert zarr_array.attrs[key] == value
+
+        # the array can be filled chunk by chunk
+        zarr_array[:5] = data[:5]
+        zarr_array[5:] = data[5:]
+        np.testing.assert_array_equal(parent_node[name][:], data)
+
+
 class TestAddChildArray:
     def test_add_child_array(self, parent_node, data, name, attributes):
         # Call the function
@@ -443,6 +498,22 @@ def test_deep_compare_async_groups_array_value_mismatch():
         deep_compare_groups(mock_group1, mock_group2, compare_values=True)
 
 
+def test_deep_compare_async_groups_chunked_value_mismatch():
+    """Values are compared block-wise, so a difference in the last chunk counts."""
+    mock_group1 = generate_group()
+    mock_group2 = generate_group()
+    arr1 = mock_group1.create("array1", dtype=np.float32, shape=(10, 2), chunks=(3, 2))
+    arr2 = mock_group2.create("array1", dtype=np.float32, shape=(10, 2), chunks=(3, 2))
+
+    arr1[:] = np.zeros((10, 2))
+    arr2[:] = np.zeros((10, 2))
+    deep_compare_groups(mock_group1, mock_group2, compare_values=True)
+
+    arr2[9, 1] = 1
+    with pytest.raises(ArrayValueMismatchError):
+        deep_compare_groups(mock_group1, mock_group2, compare_values=True)
+
+
 def test_deep_compare_async_groups_root_name_mismatch():
     mock_group1 = generate_group("a")
     mock_group2 = generate_group("a")